@@ -1,9 +1,18 @@
+import functools
+import re
+
 from maya import cmds, mel  # noqa: F401
 from maya.api import OpenMaya as om  # noqa: F401
 from py import ContextManager
 
 from .log import logger  # noqa: F401
 
+_UUID_PATTERN = re.compile('[0-9A-F]{8}(?:-[0-9A-F]{4}){3}-[0-9A-F]{12}$')
+
+#: selection modes, most common first so the query loop exits early
+_SELECT_MODES = ('object', 'component', 'root', 'leaf', 'template',
+                 'hierarchical', 'preset')
+
 
 def get_selection_mode() -> str:
     """Get the current selection mode.
@@ -11,8 +20,7 @@ def get_selection_mode() -> str:
     Returns:
         selection mode. Default: 'object'
     """
-    for x in ['object', 'component', 'root', 'leaf', 'template',
-              'hierarchical', 'preset']:
+    for x in _SELECT_MODES:
         if cmds.selectMode(**{'q': True, x: True}):
             return x
     return 'object'
@@ -27,13 +35,107 @@ class KeepSel(ContextManager):
     """current selection mode"""
 
     def __enter__(self):
-        self.sel = cmds.ls(sl=1)
+        # long names stay comparable even when edits inside the scope
+        # change which short form is unique
+        self.sel = cmds.ls(sl=1, l=1)
         self.mode = get_selection_mode()
 
     def __exit__(self, exc_type, exc_val, exc_traceback):
-        cmds.selectMode(**{self.mode: True})
-        cmds.select([x for x in self.sel if cmds.objExists(x)], ne=1)
+        # setting the mode triggers a UI refresh; skip it when unchanged
+        if get_selection_mode() != self.mode:
+            cmds.selectMode(**{self.mode: True})
+        # one ls call filters out deleted nodes, instead of an objExists
+        # round-trip per name
+        existing = set(cmds.ls(self.sel, l=1) or []) if self.sel else set()
+        cmds.select([x for x in self.sel if x in existing], ne=1)
 
 
-def name_to_node(name):
+def is_uuid(name: str) -> bool:
+    """Check whether input string is formatted like a maya node uuid.
+
+    Args:
+        name: string to test.
+
+    Returns:
+        True if the string matches Maya's uuid format.
+    """
+    return bool(_UUID_PATTERN.match(name))
+
+
+@functools.lru_cache(maxsize=4096)
+def _name_to_node(name: str) -> om.MObject:
+    if _UUID_PATTERN.match(name):
+        sel = om.MSelectionList()
+        sel.add(om.MUuid(name))
+        return sel.getDependNode(0)
     return om.MGlobal.getSelectionListByName(name).getDependNode(0)
+
+
+def name_to_node(name):
+    if isinstance(name, om.MObject):
+        return name
+    return _name_to_node(name)
+
+
+@functools.lru_cache(maxsize=1)
+def _namespaces() -> set[str]:
+    return set(cmds.namespaceInfo(lon=True, r=True) or [])
+
+
+def edit_namespace(**kwargs):
+    """Run cmds.namespace and keep the cached namespace set coherent.
+
+    Args:
+        kwargs: passed through to cmds.namespace.
+
+    Returns:
+        whatever cmds.namespace returns for the given flags.
+    """
+    result = cmds.namespace(**kwargs)
+    _namespaces.cache_clear()
+    return result
+
+
+def namespace_exists(name: str) -> bool:
+    """Check namespace existence against a cached namespace set.
+
+    One namespaceInfo query answers any number of existence checks, as
+    long as namespace edits go through edit_namespace.
+
+    Args:
+        name: namespace to look for, with or without a leading ':'.
+
+    Returns:
+        True if the namespace exists in the current scene.
+    """
+    return name.lstrip(':') in _namespaces()
+
+
+# names and namespaces resolve differently across scenes, so drop the memos
+# whenever the current scene is replaced - or extended: imports and
+# reference edits add and remove namespaces without going through
+# edit_namespace.
+def _clear_scene_caches(*args):
+    _name_to_node.cache_clear()
+    _namespaces.cache_clear()
+
+
+for _event in (om.MSceneMessage.kBeforeNew,
+               om.MSceneMessage.kBeforeOpen,
+               om.MSceneMessage.kAfterImport,
+               om.MSceneMessage.kAfterCreateReference,
+               om.MSceneMessage.kAfterLoadReference,
+               om.MSceneMessage.kAfterUnloadReference,
+               om.MSceneMessage.kAfterRemoveReference):
+    om.MSceneMessage.addCallback(_event, _clear_scene_caches)
+
+
+# deletions free names for reuse and renames reassign them, either of which
+# would leave the memo pointing at the wrong (possibly dead) node; additions
+# can't steal an existing name, so they don't need to invalidate.
+def _clear_name_cache(*args):
+    _name_to_node.cache_clear()
+
+
+om.MDGMessage.addNodeRemovedCallback(_clear_name_cache, 'dependNode')
+om.MNodeMessage.addNameChangedCallback(om.MObject.kNullObj, _clear_name_cache)
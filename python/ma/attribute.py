@@ -1,4 +1,11 @@
-from . import cmds
+from . import cmds, om
+
+# bound once at import; state() runs per-attribute in UI refresh loops
+_currentTime = cmds.currentTime
+_getAttr = cmds.getAttr
+_keyframe = cmds.keyframe
+_MSelectionList = om.MSelectionList
+_kAnimCurve = om.MFn.kAnimCurve
 
 
 def state(attr: str) -> int:
@@ -14,16 +21,18 @@ def state(attr: str) -> int:
         3 = animated, key at current frame
         4 = animated, modified value of key at current time.
     """
-    src = (cmds.listConnections(attr, s=1, d=0) or (None,))[0]
-    f = cmds.currentTime(q=1)
-    if not src:
+    sel = _MSelectionList()
+    sel.add(attr)  # resolves nested and indexed plug paths alike
+    sources = sel.getPlug(0).connectedTo(True, False)
+    if not sources:
         return 0  # not connected
-    if not cmds.objectType(src, isa='animCurve'):
+    if not sources[0].node().hasFn(_kAnimCurve):
         return 1  # connected, not editable
-    keyframes = cmds.keyframe(attr, q=1, tc=1)
-    if f not in keyframes:
+    keys = _keyframe(attr, q=1, tc=1, vc=1)
+    keyframes = dict(zip(keys[::2], keys[1::2]))
+    key = keyframes.get(_currentTime(q=1))
+    if key is None:
         return 2  # animated, no key at current time
-    key = cmds.keyframe(attr, q=1, vc=1)[keyframes.index(f)]
-    if cmds.getAttr(attr) == key:
+    if _getAttr(attr) == key:
         return 3  # animated, key at current frame
     return 4  # animated, modified value of key at current time
@@ -7,9 +7,12 @@ ScriptEditor.
 import maya.utils
 from py.log import TIMED_FORMATTER, get_logger, logger  # noqa
 
-gui_log_handler = maya.utils.MayaGuiLogHandler()
-gui_log_handler.setFormatter(TIMED_FORMATTER)
-
-if not any(isinstance(x, maya.utils.MayaGuiLogHandler)
-           for x in logger.handlers):
+# reuse any registered handler (subclasses included) so hot-reloads don't
+# stack duplicates, which would multiply the formatting work of every line
+gui_log_handler = next(
+    (x for x in logger.handlers
+     if isinstance(x, maya.utils.MayaGuiLogHandler)), None)
+if gui_log_handler is None:
+    gui_log_handler = maya.utils.MayaGuiLogHandler()
+    gui_log_handler.setFormatter(TIMED_FORMATTER)
     logger.addHandler(gui_log_handler)
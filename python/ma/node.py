@@ -1,13 +1,54 @@
-from collections import OrderedDict
+import logging
+import weakref
 from typing import Optional
 
-from . import KeepSel, cmds, log, name_to_node, om
+from . import (KeepSel, cmds, edit_namespace, is_uuid, log, name_to_node,
+               namespace_exists, om)
 
 logger = log.get_logger(__name__)
 SYSTEM_TYPE_ATTR_NAME = 'system_type'
-
-
-def add_system_attr(obj: str, value: str):
+_NS_SEP = ':'
+
+_WATCHERS: dict[str, 'weakref.WeakSet[Node]'] = {}
+"""Live Node wrappers per uuid, weakly held, so the single rename callback
+below can drop their name caches without pinning transient instances."""
+
+
+def _on_name_changed(obj: om.MObject, prev_name: str, client_data):
+    """Shared rename callback: clear the caches of the renamed node's
+    wrappers."""
+    uuid = om.MFnDependencyNode(obj).uuid().asString()
+    watchers = _WATCHERS.get(uuid)
+    if watchers:
+        for instance in list(watchers):
+            instance._clear_name_caches()
+    elif watchers is not None:
+        del _WATCHERS[uuid]  # every wrapper got collected
+
+
+om.MNodeMessage.addNameChangedCallback(om.MObject.kNullObj, _on_name_changed)
+
+# bound once at import; these run per-node during bulk scene builds
+_createNode = cmds.createNode
+_ls = cmds.ls
+_rename = cmds.rename
+
+# known DAG-ness of common root node types, letting subclasses skip the
+# per-instance hasFn probe
+_NODETYPE_IS_DAG = {
+    'transform': True,
+    'joint': True,
+    'locator': True,
+    'blendColors': False,
+    'blendWeighted': False,
+    'condition': False,
+    'network': False,
+    'plusMinusAverage': False,
+}
+
+
+def add_system_attr(
+        obj: str, value: str, fn: Optional[om.MFnDependencyNode] = None):
     """Add the SystemType attribute to a node.
 
     Used to identify and cast instances of System subclasses.
@@ -15,26 +56,53 @@ def add_system_attr(obj: str, value: str):
     Args:
         obj: name of maya node where to add the attribute.
         value: system type value.
+        fn: function set already attached to the node, to be reused when the
+            caller has one at hand.
     """
-    if not cmds.attributeQuery(SYSTEM_TYPE_ATTR_NAME, n=obj, ex=1):
+    if fn is None:
+        fn = om.MFnDependencyNode(name_to_node(obj))
+    # the API answers the existence query; edits stay on undoable commands
+    if not fn.hasAttribute(SYSTEM_TYPE_ATTR_NAME):
         cmds.addAttr(obj, ln=SYSTEM_TYPE_ATTR_NAME, dt='string')
     cmds.setAttr('.'.join([obj, SYSTEM_TYPE_ATTR_NAME]), value, type='string')
 
 
-class Node(str):
+class Node:
     """Baseclass for complex structures represented by a Maya node.
 
-    The class derives from str and is initialized with a node's UUID.
+    Instances are identified by their root node's UUID, which str conversion
+    exposes. Slots keep them lightweight across node-heavy scenes.
     """
 
+    __slots__ = ('dependnode', '_fn', '_handle', '_uuid', '_hash', '_is_dag',
+                 '_name_cache', '_ns_cache', '_nodename_cache', '__weakref__')
+
     DEFAULT_NAME: str = 'grp'
     """Default node name when using namespaces."""
     _NODETYPE: str = 'transform'
     """Type of node to be created as root object"""
-    dependnode: om.MObject = None
+    dependnode: om.MObject
     """Cached api object of this system's root node."""
     fn: om.MFnDependencyNode
     """Cached api function set to work with this system's root DependNode."""
+    _uuid: str
+    """This root node's uuid, returned by str conversion."""
+    _is_dag: bool
+    """Whether the root node lives in the DAG, decided at construction."""
+    _IS_DAG: Optional[bool] = None
+    """DAG-ness of _NODETYPE, resolved at class-creation time. None means
+    unknown, making __new__ fall back to a per-instance probe."""
+    _name_cache: Optional[str]
+    """Cached node name, dropped whenever Maya renames the node."""
+    _ns_cache: Optional[str]
+    """Cached namespace, dropped whenever Maya renames the node."""
+    _nodename_cache: Optional[str]
+    """Cached path-less node name, dropped whenever Maya renames the node."""
+
+    def __init_subclass__(cls, **kwargs):
+        """Resolve the declared root type's DAG-ness once per subclass."""
+        super().__init_subclass__(**kwargs)
+        cls._IS_DAG = _NODETYPE_IS_DAG.get(cls._NODETYPE)
 
     def __new__(cls, value: str | om.MObject) -> 'Node':
         """Initialize a Node from its root node uuid.
@@ -49,16 +117,38 @@ class Node(str):
         if isinstance(value, str):
             value = name_to_node(value)
         if value:
-            fn = om.MFnDagNode()
-            if fn.hasObj(value):
-                fn.setObject(value)
-            else:
-                fn = om.MFnDependencyNode(value)
-            self = super().__new__(cls, fn.uuid())
+            is_dag = cls._IS_DAG
+            if is_dag is None:
+                is_dag = value.hasFn(om.MFn.kDagNode)
+            try:
+                fn = (om.MFnDagNode(value)
+                      if is_dag else
+                      om.MFnDependencyNode(value))
+            except (RuntimeError, TypeError, ValueError):
+                # node doesn't match the declared root type; probe it
+                is_dag = value.hasFn(om.MFn.kDagNode)
+                fn = (om.MFnDagNode(value)
+                      if is_dag else
+                      om.MFnDependencyNode(value))
+            self = super().__new__(cls)
+            uuid = fn.uuid().asString()
+            self._uuid = uuid
+            self._hash = hash(uuid)
+            self._is_dag = is_dag
             self.dependnode = value
             self._fn = fn
+            self._handle = om.MObjectHandle(value)
+            self._name_cache = None
+            self._ns_cache = None
+            self._nodename_cache = None
+            _WATCHERS.setdefault(uuid, weakref.WeakSet()).add(self)
             return self
 
+    def _clear_name_caches(self, *args):
+        self._name_cache = None
+        self._ns_cache = None
+        self._nodename_cache = None
+
     def __eq__(self, other: 'Node') -> bool:
         """Nodes are equal if their class and str conversion (uuid) are equal.
 
@@ -68,10 +158,18 @@ class Node(str):
         Returns:
             True if input value is equal to this Node instance.
         """
-        return self.__class__ == other.__class__ and super().__eq__(other)
+        return type(self) is type(other) and self._uuid == other._uuid
 
     def __hash__(self) -> int:
-        return hash(str(self))
+        return self._hash
+
+    def __str__(self) -> str:
+        """The uuid of this Node's maya root node.
+
+        Returns:
+            uuid string.
+        """
+        return self._uuid
 
     def __repr__(self) -> str:
         """String representation of a Node.
@@ -102,12 +200,16 @@ class Node(str):
             class instance.
         """
         if parent is not None:
-            parent = cmds.ls(parent)[0]
+            # uuids are unique by construction; skip the cmds.ls resolution
+            parent = (om.MFnDagNode(name_to_node(parent)).partialPathName()
+                      if is_uuid(parent) else
+                      _ls(parent)[0])
         name = name or cls._NODETYPE
-        logger.debug(f"Creating {cls.__name__}({name})")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Creating {cls.__name__}({name})")
         if name.endswith(':'):
             name += cls.DEFAULT_NAME
-        root = cmds.createNode(cls._NODETYPE, name=name, parent=parent, ss=1)
+        root = _createNode(cls._NODETYPE, name=name, parent=parent, ss=1)
         return cls(root)
 
     @classmethod
@@ -136,11 +238,14 @@ class Node(str):
     def delete(self):
         """Delete this Node"""
         ns = self.namespace
-        node_repr = repr(self)
+        # repr hits Maya for the node name; skip it unless debug is on
+        debug = logger.isEnabledFor(logging.DEBUG)
+        node_repr = repr(self) if debug else ''
         cmds.delete(self.name)
         if ns and not cmds.namespaceInfo(ns, ls=1):
-            cmds.namespace(rm=ns)
-        logger.debug(f"{node_repr} deleted")
+            edit_namespace(rm=ns)
+        if debug:
+            logger.debug(f"{node_repr} deleted")
 
     @KeepSel()
     def export(self, filename: str, **kwargs):
@@ -161,9 +266,14 @@ class Node(str):
         Returns:
             name of this node
         """
-        if isinstance(self.fn, om.MFnDagNode):
-            return self.fn.partialPathName()
-        return self.fn.name()
+        # cache hits still honor the fn validity guard: a dead node must
+        # raise rather than return a name another node may now own
+        name = self._name_cache
+        if name is None or not self._handle.isValid():
+            fn = self.fn
+            name = self._name_cache = (
+                fn.partialPathName() if self._is_dag else fn.name())
+        return name
 
     def rename(self, value: str):
         """Set the name of the maya node.
@@ -171,30 +281,34 @@ class Node(str):
         Args:
             value: new name
         """
-        sep = ':'
-        if sep in self.name:
-            if sep in value:
-                self.namespace = value.rsplit(sep, 1)[0]
+        name = self.name
+        if _NS_SEP in name:
+            if _NS_SEP in value:
+                self.namespace = value.rsplit(_NS_SEP, 1)[0]
             else:
                 self.namespace = ''
-        if value[-1] == sep:
+            name = self.name  # namespace edits rename the node
+        if value.endswith(_NS_SEP):
             value += self.DEFAULT_NAME
-        cmds.rename(self.name, value)
+        _rename(name, value)
 
-    def serialize(self) -> OrderedDict:
+    def serialize(self) -> dict:
         """Serialize this Node instance.
 
+        Subclasses extend the returned dict, relying on its insertion order.
+
         Returns:
             required data to rebuild this Node (sub)class.
         """
-        logger.log(5, f'Serializing {self!r}')
-        return OrderedDict(type=self.__class__.__name__)
+        if logger.isEnabledFor(5):
+            logger.log(5, f'Serializing {self!r}')
+        return {'type': type(self).__name__}
 
     name = property(get_name, rename)
 
     @property
     def fn(self) -> om.MFnDependencyNode:
-        if om.MObjectHandle(self.dependnode).isValid():
+        if self._handle.isValid():
             return self._fn
         raise RuntimeError(
             f'Invalid depend node. {type(self).__name__}({self}) not found')
@@ -209,7 +323,10 @@ class Node(str):
         Returns:
             namespace of the maya node.
         """
-        return self.fn.namespace
+        ns = self._ns_cache
+        if ns is None or not self._handle.isValid():
+            ns = self._ns_cache = self.fn.namespace
+        return ns
 
     @namespace.setter
     def namespace(self, value: str):
@@ -217,17 +334,19 @@ class Node(str):
         if ns:
             if value:
                 sep = ':'
-                if cmds.namespace(ex=value):
-                    cmds.namespace(mv=(ns, value))
+                if namespace_exists(value):
+                    edit_namespace(mv=(ns, value))
                 elif sep in value:
                     par, value = value.rsplit(sep, 1)
-                    if not cmds.namespace(ex=par):
-                        cmds.namespace(add=par)
-                    cmds.namespace(ren=(self.namespace, value), p=par)
+                    if not namespace_exists(par):
+                        edit_namespace(add=par)
+                    edit_namespace(ren=(self.namespace, value), p=par)
                 else:
-                    cmds.namespace(ren=(self.namespace, value))
+                    edit_namespace(ren=(self.namespace, value))
             else:
-                cmds.namespace(rm=ns, mnr=1)
+                edit_namespace(rm=ns, mnr=1)
+            # namespace edits don't always fire per-node rename callbacks
+            self._clear_name_caches()
 
     @property
     def nodename(self) -> str:
@@ -236,7 +355,10 @@ class Node(str):
         Returns:
             node name.
         """
-        return self.fn.name()
+        name = self._nodename_cache
+        if name is None or not self._handle.isValid():
+            name = self._nodename_cache = self.fn.name()
+        return name
 
 
 class System(Node):
@@ -247,6 +369,21 @@ class System(Node):
     of scene contents that may require so.
     """
 
+    __slots__ = ('_system_type_plug',)
+
+    def _type_plug(self) -> om.MPlug:
+        """Get the system type attribute's plug, resolving it only once.
+
+        Returns:
+            plug of the system type attribute.
+        """
+        try:
+            return self._system_type_plug
+        except AttributeError:
+            plug = self._system_type_plug = self.fn.findPlug(
+                SYSTEM_TYPE_ATTR_NAME, False)
+            return plug
+
     @classmethod
     def create(
             cls, name: Optional[str] = None, parent: Optional[str] = None
@@ -267,13 +404,19 @@ class System(Node):
         Returns:
             class instance.
         """
-        self: System = super().create(name, parent)
-        self.create_attributes()
+        # one undo chunk collapses the createNode/addAttr/setAttr commands
+        # into a single undoable step
+        cmds.undoInfo(openChunk=True, chunkName=f'{cls.__name__}.create')
+        try:
+            self: System = super().create(name, parent)
+            self.create_attributes()
+        finally:
+            cmds.undoInfo(closeChunk=True)
         return self
 
     def create_attributes(self):
         """Add any missing attributes expected in this system."""
-        add_system_attr(self.name, self.__class__.__name__)
+        add_system_attr(self.name, self.__class__.__name__, fn=self.fn)
 
     @property
     def type(self) -> str:
@@ -287,7 +430,7 @@ class System(Node):
         Returns:
             current value of the system type attribute
         """
-        return cmds.getAttr(f'{self.name}.{SYSTEM_TYPE_ATTR_NAME}')
+        return self._type_plug().asString()
 
     @type.setter
     def type(self, value: str):
@@ -7,14 +7,108 @@ Two main System subclasses are defined in this module:
   own attribute Poser.
 
 """
-from collections import OrderedDict
+import contextlib
+import functools
+import re
+from collections import defaultdict
+from numbers import Real
 
-from ma import attribute, cmds, node  # control, reader
+from ma import attribute, cmds, node, om  # control, reader
 from py import IndexableGenerator
 
 POSERSET_ATTR_NAME = 'poser_set'
 REPRESENTANT_ATTR_NAME = 'representant'
 
+_INDEX_PATTERN = re.compile(r'\[(\d+)\]')
+
+
+@functools.lru_cache(maxsize=2048)
+def _attr_type(node_type, attr):
+    """Memoized attribute data type lookup.
+
+    Static attribute types depend only on the node type's schema, so the
+    query result is shared by every node of that type.
+
+    Args:
+        node_type (str): maya node type.
+        attr (str): attribute name.
+
+    Returns:
+        str or None:
+            maya attribute type, or None for dynamic attributes, which
+            aren't part of the static schema.
+    """
+    try:
+        return cmds.attributeQuery(attr, typ=node_type, at=1)
+    except RuntimeError:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _poser_class_for(obj):
+    """Memoized factory lookup of the Poser subclass for a root node.
+
+    Args:
+        obj (str): name of a maya node (supposedly a Poser).
+
+    Returns:
+        class or None: the adequate Poser subclass to instantiate.
+    """
+    cls = node.factory.get_system_class(obj)
+    if cls is not None and issubclass(cls, Poser):
+        return cls
+
+
+@functools.lru_cache(maxsize=1024)
+def _poser_for(obj):
+    """Memoized Poser instantiation for a root node.
+
+    Args:
+        obj (str): name of a maya node (supposedly a Poser).
+
+    Returns:
+        Poser or None: sub-class instance, if the node is a poser root.
+    """
+    cls = _poser_class_for(obj)
+    if cls is not None:
+        return cls(obj)
+
+
+_CTL_POSER_CACHE = {}
+
+
+def clear_control_poser_cache():
+    """Drop cached control poser lookups.
+
+    Call after structurally editing posers outside this module's helpers.
+    """
+    _CTL_POSER_CACHE.clear()
+
+
+def _invalidate_poser_lookups():
+    """Drop poser lookup memos after posers are created or deleted.
+
+    Node names can be reused across such edits, so both the class memo and
+    the per-control cache would otherwise serve stale entries.
+    """
+    _poser_class_for.cache_clear()
+    _poser_for.cache_clear()
+    _CTL_POSER_CACHE.clear()
+
+
+# lookups don't survive scene changes; drop the memos with the scene
+def _clear_scene_caches(*args):
+    _invalidate_poser_lookups()
+
+
+for _event in (om.MSceneMessage.kBeforeNew, om.MSceneMessage.kBeforeOpen):
+    om.MSceneMessage.addCallback(_event, _clear_scene_caches)
+
+# the memos are keyed by node name, so renames - which free a name for
+# Maya to hand to an unrelated node - must invalidate them as well
+om.MNodeMessage.addNameChangedCallback(
+    om.MObject.kNullObj, lambda *_: _invalidate_poser_lookups())
+
 
 def create_poser(attr, representant=None):
     """Create an Attribute Poser to drive an attribute.
@@ -28,8 +122,9 @@ def create_poser(attr, representant=None):
         Poser: sub-class instance.
     """
     at = attr.rsplit('.', 1)
-    cls = POSERS_MAP[cmds.attributeQuery(at[1], node=at[0], at=1)]
-    return cls.create(attr, representant)
+    attr_type = (_attr_type(cmds.nodeType(at[0]), at[1])
+                 or cmds.attributeQuery(at[1], node=at[0], at=1))
+    return POSERS_MAP[attr_type].create(attr, representant)
 
 
 def get_control_poser_node(ctl, poser_set):
@@ -62,22 +157,49 @@ def get_control_poser_nodes(ctl):
     parent up towards the root of the hierarchy, for attribute Posers. Return
     those which have any and the posers themselves. These usually serve
 
+    Results are cached per control until the scene changes or
+    clear_control_poser_cache is called, as serialization resolves many
+    poser sets against the same controls.
+
     Args:
         ctl (control.Control or str):
             Control instance or name of a control transform node.
 
-    Yields:
-        tuple:
-            node name and a list of associate attribute posers per pose-driven
-            transform node of the input control.
+    Returns:
+        tuple of tuple:
+            node name and a tuple of associate attribute posers per
+            pose-driven transform node of the input control.
     """
     if not isinstance(ctl, control.Control):
         ctl = control.Control(ctl)
-    for x in ctl.transforms:
-        posers = tuple(y for y in get_posers(x)
-                       if (y.representant or '').split('.', 1)[0] == ctl)
+    key = str(ctl)
+    cached = _CTL_POSER_CACHE.get(key)
+    if cached is not None:
+        return cached
+    # one connection query resolves every poser represented by this control,
+    # saving a representant read per candidate poser
+    connections = cmds.listConnections(str(ctl), s=0, d=1, p=1, c=1) or []
+    represented = {dest.split('.', 1)[0]
+                   for dest in connections[1::2]
+                   if dest.rsplit('.', 1)[-1] == REPRESENTANT_ATTR_NAME}
+    # likewise, one query gathers the input nodes of the whole transforms
+    # stack, so poser-less transforms are pruned without a call each
+    transforms = list(ctl.transforms)
+    connections = cmds.listConnections(
+        transforms, s=1, d=0, scn=1, p=1, c=1) or []
+    inputs = {}
+    for dest, src in zip(connections[::2], connections[1::2]):
+        inputs.setdefault(dest.split('.', 1)[0], set()).add(
+            src.split('.', 1)[0])
+    result = []
+    for x in transforms:
+        posers = tuple(cls(y) for y in inputs.get(x, ())
+                       if y in represented
+                       and (cls := _poser_class_for(y)) is not None)
         if posers:
-            yield x, posers
+            result.append((x, posers))
+    result = _CTL_POSER_CACHE[key] = tuple(result)
+    return result
 
 
 def get_posers(node):
@@ -90,9 +212,9 @@ def get_posers(node):
         Poser: Poser sub-class instances.
     """
     for input_node in set(cmds.listConnections(node, s=1, d=0, scn=1) or []):
-        cls = Poser.get_class(input_node)
-        if cls is not None:
-            yield cls(input_node)
+        poser = _poser_for(input_node)
+        if poser is not None:
+            yield poser
 
 
 class Poser(node.System):
@@ -125,6 +247,16 @@ class Poser(node.System):
     as it's influence is considered negligible. Set threshold to 0 to
     disable this behavior."""
 
+    __slots__ = ('_mi_cache',)
+
+    def __init__(self, *args, **kwargs):
+        """Initialize the per-instance multi-index snapshot slot.
+
+        Held as None outside batch_read scopes. Slots keep poser instances
+        dict-free across node-heavy scenes.
+        """
+        self._mi_cache = None
+
     @classmethod
     def create(cls, attr, representant=None):
         """Create a new attribute Poser to drive a given maya attribute.
@@ -149,6 +281,7 @@ class Poser(node.System):
         cmds.setAttr(f'{self.input}[0]',
                      *cmds.attributeQuery(attr[1], node=attr[0], ld=1))
 
+        _invalidate_poser_lookups()
         return self
 
     @staticmethod
@@ -165,25 +298,80 @@ class Poser(node.System):
             class or None:
                 the adequate Poser subclass to instantiate from input node
         """
-        cls = node.factory.get_system_class(node)
-        if cls is not None and issubclass(cls, Poser):
-            return cls
+        return _poser_class_for(node)
+
+    @contextlib.contextmanager
+    def batch_read(self):
+        """Snapshot multi-index queries for the duration of a scope.
+
+        Within the scope, repeated multi-index reads on this poser are
+        served from a memo. Pose additions and removals invalidate it.
+
+        Yields:
+            Poser: this instance.
+        """
+        self._mi_cache = {}
+        try:
+            yield self
+        finally:
+            self._mi_cache = None
+
+    def _invalidate_multi_indices(self):
+        """Drop any multi-index snapshot after a pose stack edit."""
+        if self._mi_cache is not None:
+            self._mi_cache.clear()
+
+    def _multi_indices(self, attr):
+        """Get the existing multi indices of input attribute.
+
+        Served from the batch_read snapshot when one is active.
+
+        Args:
+            attr (str): multi attribute name.
+
+        Returns:
+            list of int or None: existing indices.
+        """
+        cache = self._mi_cache
+        if cache is None:
+            return cmds.getAttr(attr, mi=1)
+        try:
+            return cache[attr]
+        except KeyError:
+            result = cache[attr] = cmds.getAttr(attr, mi=1)
+            return result
+
+    def collect_teardown(self):
+        """Gather what's needed to tear this poser down.
+
+        Lets callers batch the teardown of several posers into a single
+        delete call.
+
+        Returns:
+            tuple:
+                (driven attribute, default value) restoration pair, and the
+                list of nodes (pose nodes and root) to delete.
+        """
+        restoration = (self.attr, self.get_pose_value(0))
+        nodes = cmds.listConnections(self.input, s=1, d=0, scn=1) or []
+        nodes.append(self.name)
+        return restoration, nodes
 
     def delete(self):
         """Remove Poser and all it's pose nodes."""
-        attr = self.attr
+        (attr, default_value), nodes = self.collect_teardown()
 
         # disconnect driven attribute and set it to the default value
-        default_value = self.get_pose_value(0)
         cmds.disconnectAttr(self.output, attr)
         try:
             cmds.setAttr(attr, *default_value)
         except TypeError:
             cmds.setAttr(attr, default_value)
 
-        # remove all pose nodes and the poser node itself
-        [self.remove_pose(i) for i in cmds.getAttr(self.input, mi=1)[:0:-1]]
-        cmds.delete(self.name)
+        # one batched delete removes the pose nodes and the poser itself;
+        # the DG cleans up the multi-instance entries with their upstream
+        cmds.delete(*nodes)
+        _invalidate_poser_lookups()
 
     def add_pose(self):
         """Create a new pose entry in this poser.
@@ -196,6 +384,39 @@ class Poser(node.System):
         """
         raise NotImplementedError
 
+    def find_pose(self, outputs):
+        """Find this poser's pose entry weighted by one of input plugs.
+
+        Args:
+            outputs (set of str): candidate pose weight plugs.
+
+        Returns:
+            int or None: index of the matching pose entry, if any.
+        """
+        plug_map = self.pose_weight_plug_map()
+        for plug in outputs.intersection(plug_map):
+            return plug_map[plug]
+        return None
+
+    def pose_weight_plug_map(self):
+        """Map each pose's weight plug to its index in the input stack.
+
+        All pose connections are resolved in a single query, instead of one
+        per stack entry.
+
+        Returns:
+            dict: {weight plug (str): stack index (int)} pairs.
+        """
+        connections = cmds.listConnections(
+            self.input, s=1, d=0, scn=1, p=1, c=1) or []
+        weight_attr = self.pose_weight_attr
+        result = {}
+        for dest, src in zip(connections[::2], connections[1::2]):
+            index = int(_INDEX_PATTERN.search(dest).group(1))
+            if index > 0:
+                result[f"{src.split('.', 1)[0]}{weight_attr}"] = index
+        return result
+
     def get_pose(self, index=None):
         """Get the pose at given index in this poser.
 
@@ -211,7 +432,7 @@ class Poser(node.System):
         """
         input_attr = self.input
         if index is None:
-            index = cmds.getAttr(input_attr, mi=1)[-1]
+            index = self._multi_indices(input_attr)[-1]
         if index < 1:
             return None
         connections = cmds.listConnections(
@@ -247,17 +468,16 @@ class Poser(node.System):
         """
         input_attr = self.input
         if index is None:
-            index = cmds.getAttr(input_attr, mi=1)[-1]
+            index = self._multi_indices(input_attr)[-1]
         if index < 1:
             raise ValueError("can't remove neutral pose")
         input_attr += f'[{index}]'
-        pose = cmds.listConnections(input_attr, s=1, d=0, scn=1)
-        if pose:
-            cmds.disconnectAttr(
-                cmds.listConnections(input_attr, s=1, d=0, scn=1, plugs=1)[0],
-                input_attr)
-            cmds.delete(pose[0])
+        plugs = cmds.listConnections(input_attr, s=1, d=0, scn=1, plugs=1)
+        if plugs:
+            cmds.disconnectAttr(plugs[0], input_attr)
+            cmds.delete(plugs[0].split('.', 1)[0])
         cmds.removeMultiInstance(input_attr, b=1)
+        self._invalidate_multi_indices()
 
     def set_pose_value(self, index, *value):
         """Set the value of pose at a given index.
@@ -271,6 +491,28 @@ class Poser(node.System):
             return self.remove_pose(index)
         cmds.setAttr(self.get_pose(index).format(self.pose_value_attr), *value)
 
+    def _resolve_pose_paths(self, indices):
+        """Resolve the value attribute path of each input pose index.
+
+        A single connection query maps stack indices to pose nodes, instead
+        of one query per index.
+
+        Args:
+            indices (iterable of int): index of each pose to resolve.
+
+        Returns:
+            list of str: pose value attribute paths, in input order.
+        """
+        input_attr = self.input
+        connections = cmds.listConnections(
+            input_attr, s=1, d=0, scn=1, p=1, c=1) or []
+        nodes = {int(_INDEX_PATTERN.search(dest).group(1)):
+                 src.split('.', 1)[0]
+                 for dest, src in zip(connections[::2], connections[1::2])}
+        value_attr = self.pose_value_attr
+        return [f'{input_attr}[0]' if i == 0 else f'{nodes[i]}{value_attr}'
+                for i in indices]
+
     def sum_poses(self, indices):
         """Sum the values of two or more poses.
 
@@ -280,7 +522,8 @@ class Poser(node.System):
         Returns:
             Number: summed pose value
         """
-        return sum([self.get_pose_value(index) for index in indices])
+        return sum([cmds.getAttr(x)
+                    for x in self._resolve_pose_paths(indices)])
 
     def trim_value(self, value):
         """Prune small values by returning None if they're below the threshold.
@@ -293,13 +536,14 @@ class Poser(node.System):
             value or None:
                 input value if over the Poser's threshold, or None otherwise.
         """
-        if not self.threshold:
+        threshold = self.threshold
+        if not threshold:
             return value
-        try:
-            return None if abs(value) < self.threshold else value
-        except TypeError:
-            pass
-        return None if all(abs(x) < self.threshold for x in value) else value
+        if isinstance(value, Real):
+            return None if abs(value) < threshold else value
+        return (None
+                if max(map(abs, value), default=0) < threshold else
+                value)
 
     @property
     def attr(self):
@@ -380,11 +624,16 @@ class Poser(node.System):
             attribute.disconnect(representant_attribute)
         else:
             attribute.connect(value, representant_attribute)
+        # re-pointing a representant changes which control this poser
+        # belongs to
+        clear_control_poser_cache()
 
 
 class EnumPoser(Poser):
     """Drive a maya Enum attribute with stored poses."""
 
+    __slots__ = ()
+
     pose_value_attr = '.colorIfTrueR'
     """str: string to complete the path to the attribute holding a given pose's
     value(s). Poses are stored in extra nodes which in turn are plugged to the
@@ -404,13 +653,14 @@ class EnumPoser(Poser):
             int: index of the new pose in the poses stack.
         """
         input_attr = self.input
-        indices = cmds.getAttr(input_attr, mi=1)
+        indices = self._multi_indices(input_attr)
         index = (indices or [-1])[-1] + 1
         pose = cmds.createNode('condition', ss=1)
         cmds.setAttr(f'{pose}.operation', 2)
         cmds.setAttr(f'{pose}.secondTerm', 0.5)
         cmds.setAttr(f'{pose}.colorIfFalseR', 0)
         cmds.connectAttr(f'{pose}.outColorR', f'{input_attr}[{index}]')
+        self._invalidate_multi_indices()
         return index
 
     @property
@@ -447,8 +697,34 @@ class NumberPoser(Poser):
     """str: string to complete the path to the attribute holding a given pose's
     blending weight."""
 
+    __slots__ = ('_value_root', '_weight_root')
+
+    def __init__(self, *args, **kwargs):
+        """Initialize the cached plug prefix slots, dropped with renames."""
+        super().__init__(*args, **kwargs)
+        self._value_root = None
+        self._weight_root = None
+
+    def _clear_name_caches(self, *args):
+        super()._clear_name_caches(*args)
+        self._value_root = None
+        self._weight_root = None
+
+    def _roots(self):
+        """Pre-formatted value and weight plug prefixes, cached per name.
+
+        Returns:
+            tuple of str: value and weight plug prefixes.
+        """
+        value_root = self._value_root
+        if value_root is None:
+            root = self.name
+            value_root = self._value_root = root + self.pose_value_attr
+            self._weight_root = root + self.pose_weight_attr
+        return value_root, self._weight_root
+
     @classmethod
-    def create(cls, attr):
+    def create(cls, attr, representant=None):
         """Create a new NumberPoser to drive input maya numeric attribute.
 
         Args:
@@ -457,7 +733,7 @@ class NumberPoser(Poser):
         Returns:
             Poser: instance
         """
-        self = super().create(attr)
+        self = super().create(attr, representant)
         cmds.setAttr(f'{self.name}{self.pose_weight_attr}[0]', 1)
         return self
 
@@ -470,10 +746,11 @@ class NumberPoser(Poser):
         Returns:
             int: index of the new pose in the poses stack.
         """
-        index = cmds.getAttr(self.name + self.pose_value_attr, mi=1)[-1] + 1
-        pose = self.get_pose(index)
-        cmds.setAttr(pose.format(self.pose_value_attr), 0)
-        cmds.setAttr(pose.format(self.pose_weight_attr), 0)
+        value_root, weight_root = self._roots()
+        index = self._multi_indices(value_root)[-1] + 1
+        cmds.setAttr(f'{value_root}[{index}]', 0)
+        cmds.setAttr(f'{weight_root}[{index}]', 0)
+        self._invalidate_multi_indices()
         return index
 
     def delete(self):
@@ -486,6 +763,35 @@ class NumberPoser(Poser):
         cmds.disconnectAttr(self.output, attr)
         cmds.setAttr(attr, default_value)
         cmds.delete(self.name)
+        _invalidate_poser_lookups()
+
+    def pose_weight_plug_map(self):
+        """Map each pose's weight plug to its index in the input stack.
+
+        Weight plugs live on the poser's root node itself, so a single
+        multi-index query resolves the whole stack.
+
+        Returns:
+            dict: {weight plug (str): stack index (int)} pairs.
+        """
+        value_root, weight_root = self._roots()
+        return {f'{weight_root}[{i}]': i
+                for i in self._multi_indices(value_root)[1:]}
+
+    def _resolve_pose_paths(self, indices):
+        """Resolve the value attribute path of each input pose index.
+
+        Values live on the poser root's multi attribute, so no connection
+        query is needed.
+
+        Args:
+            indices (iterable of int): index of each pose to resolve.
+
+        Returns:
+            list of str: pose value attribute paths, in input order.
+        """
+        input_attr = self.input
+        return [f'{input_attr}[{i}]' for i in indices]
 
     def get_pose(self, index):
         """Get the pose at given index in this poser.
@@ -513,10 +819,10 @@ class NumberPoser(Poser):
         """
         if index < 1:
             raise ValueError("can't remove neutral pose")
-        root = self.name
-        cmds.removeMultiInstance(f'{root}{self.pose_value_attr}[{index}]', b=1)
-        cmds.removeMultiInstance(
-            f'{root}{self.pose_weight_attr}[{index}]', b=1)
+        value_root, weight_root = self._roots()
+        cmds.removeMultiInstance(f'{value_root}[{index}]', b=1)
+        cmds.removeMultiInstance(f'{weight_root}[{index}]', b=1)
+        self._invalidate_multi_indices()
 
     def set_pose_value(self, index, value):
         """Set the value of pose at a given index.
@@ -538,7 +844,7 @@ class NumberPoser(Poser):
         Returns:
             str: attribute name
         """
-        return self.name + self.pose_value_attr
+        return self._roots()[0]
 
     @property
     def output(self):
@@ -560,13 +866,15 @@ class NumberPoser(Poser):
             int: index of the new pose in the poses stack.
         """
         root = self.name
-        indices = cmds.getAttr(root + self.pose_value_attr, mi=1)
+        indices = self._multi_indices(self._roots()[0])
         return [f'{root}{{0}}[{i}]' for i in indices[1:]]
 
 
 class Number3Poser(Poser):
     """Drive a Maya int3 or float3 attribute with stored poses."""
 
+    __slots__ = ()
+
     pose_value_attr = '.color1'
     """str: string to complete the path to the attribute holding a given pose's
     value(s). poses are stored in extra nodes which in turn are plugged to the
@@ -586,11 +894,12 @@ class Number3Poser(Poser):
             int: index of the new pose in the poses stack.
         """
         input = self.input
-        index = cmds.getAttr(input, mi=1)[-1] + 1
+        index = self._multi_indices(input)[-1] + 1
         pose = cmds.createNode('blendColors', ss=1)
         cmds.setAttr(f'{pose}.blender', 0)
         cmds.setAttr(f'{pose}.color2', 0, 0, 0)
         cmds.connectAttr(f'{pose}.output', f'{input}[{index}]')
+        self._invalidate_multi_indices()
         return index
 
     def get_pose_value(self, index):
@@ -613,7 +922,8 @@ class Number3Poser(Poser):
         Returns:
             tuple of Number: summed pose value
         """
-        values = tuple(self.get_pose_value(x) for x in indices)
+        values = (cmds.getAttr(x)[0]
+                  for x in self._resolve_pose_paths(indices))
         return tuple(sum(x) for x in zip(*values))
 
     @property
@@ -660,6 +970,55 @@ class PoserSet(node.System):
     Each pose can drive one or more of the attributes driven by the PoserSet.
     """
 
+    __slots__ = ('_pose_outputs_cache',)
+
+    def __init__(self, *args, **kwargs):
+        """Initialize the per-instance pose output plug cache slot."""
+        self._pose_outputs_cache = None
+
+    @contextlib.contextmanager
+    def _bulk_edit(self, name):
+        """Run a batch of pose edits inside a single undo chunk.
+
+        Collapses the per-command undo entries of programmatic edits into
+        one undoable step.
+
+        Args:
+            name (str): undo chunk name.
+        """
+        cmds.undoInfo(openChunk=True, chunkName=name)
+        try:
+            yield
+        finally:
+            cmds.undoInfo(closeChunk=True)
+
+    def _invalidate_pose_outputs(self):
+        """Drop cached pose output plug sets after pose edits."""
+        self._pose_outputs_cache = None
+
+    def _pose_outputs(self, pose_attr):
+        """Resolve the destination plug set of a pose attribute.
+
+        Resolutions are cached per pose attribute, so back-to-back reads of
+        the same pose share one query. Pose edits through this class drop
+        the cache.
+
+        Args:
+            pose_attr (str): full path of the pose attribute.
+
+        Returns:
+            set of str: plugs driven by the pose attribute.
+        """
+        cache = self._pose_outputs_cache
+        if cache is None:
+            cache = self._pose_outputs_cache = {}
+        try:
+            return cache[pose_attr]
+        except KeyError:
+            result = cache[pose_attr] = set(cmds.listConnections(
+                pose_attr, s=0, d=1, plugs=1) or [])
+            return result
+
     @classmethod
     def create(cls, name=None, parent=None, attrs=None):
         """Poser Set constructor.
@@ -678,9 +1037,11 @@ class PoserSet(node.System):
         """
         self = super().create(name=name, parent=parent)
         root = self.name
-        [cmds.setAttr('.'.join([root, x]), keyable=0)
-         for x in cmds.listAttr(root, k=1)]
-        [self.add_attr(x) for x in attrs or []]
+        for x in cmds.listAttr(root, k=1):
+            cmds.setAttr('.'.join([root, x]), keyable=0)
+        with self._bulk_edit(f'{cls.__name__}.create'):
+            for x in attrs or []:
+                self.add_attr(x)
         return self
 
     @classmethod
@@ -780,11 +1141,25 @@ class PoserSet(node.System):
 
         pose_attr = f'{self.name}.{self.poses[index]}'
         cmds.connectAttr(driver, pose_attr)
+        self._invalidate_pose_outputs()
         return result
 
     def delete(self):
         """Delete PoserSet and all the associated Attribute Posers."""
-        [x.delete() for x in self.posers]
+        restorations, nodes = [], []
+        for x in self.posers:
+            restoration, poser_nodes = x.collect_teardown()
+            cmds.disconnectAttr(x.output, restoration[0])
+            restorations.append(restoration)
+            nodes.extend(poser_nodes)
+        for attr, value in restorations:
+            try:
+                cmds.setAttr(attr, *value)
+            except TypeError:
+                cmds.setAttr(attr, value)
+        if nodes:
+            cmds.delete(*nodes)
+        _invalidate_poser_lookups()
         super().delete()
 
     def get_pose(self, index):
@@ -799,18 +1174,20 @@ class PoserSet(node.System):
                 each attribute Poser and the index of it's corresponding
                 attribute pose associated to the PoserSet pose.
         """
-        outputs = set(cmds.listConnections(
-            '.'.join([self.name, self.poses[index]]), s=0, d=1, plugs=1) or [])
+        yield from self._iter_pose_indices(
+            self._pose_outputs('.'.join([self.name, self.poses[index]])))
+
+    def _iter_pose_indices(self, outputs):
+        """Pair each attribute Poser with its pose weighted by input plugs.
+
+        Args:
+            outputs (set of str): pose weight plugs driven by a pose.
+
+        Yields:
+            tuple: (Poser, stack index or None) pairs.
+        """
         for poser in self.posers:
-            i = None
-            for j in cmds.getAttr(poser.input, mi=1)[1:]:
-                pose = poser.get_pose(j)
-                if pose is None:
-                    continue
-                if pose.format(poser.pose_weight_attr) in outputs:
-                    i = j
-                    break
-            yield (poser, i)
+            yield (poser, poser.find_pose(outputs))
 
     def get_pose_values(self, index):
         """Get the value of each attribute pose in a given PoserSet pose.
@@ -824,8 +1201,8 @@ class PoserSet(node.System):
                 each attribute Poser and the value of it's corresponding
                 attribute pose associated to the PoserSet pose.
         """
-        outputs = set(cmds.listConnections(
-            '.'.join([self.name, self.poses[index]]), s=0, d=1, plugs=1) or [])
+        outputs = self._pose_outputs(
+            '.'.join([self.name, self.poses[index]]))
         for poser in self.posers:
             value = None
             for pose in poser.poses:
@@ -864,9 +1241,12 @@ class PoserSet(node.System):
             index (int): index of the pose attribute in the custom attributes
             list of this PoseSet's root node.
         """
-        pose_attr = self.poses[index]
-        [p.remove_pose(i) for p, i in self.get_pose(index) if i is not None]
-        cmds.deleteAttr(f'{self.name}.{pose_attr}')
+        pose_attr = f'{self.name}.{self.poses[index]}'
+        for p, i in self._iter_pose_indices(self._pose_outputs(pose_attr)):
+            if i is not None:
+                p.remove_pose(i)
+        cmds.deleteAttr(pose_attr)
+        self._invalidate_pose_outputs()
 
     def set_pose_values(self, index, values):
         """Set the values of a pose.
@@ -881,20 +1261,23 @@ class PoserSet(node.System):
         """
 
         pose = '.'.join([self.name, self.poses[index]])
-        for poser, i in self.get_pose(index):
-            value = values.get(poser, None)
-            if value is None or poser.trim_value(value) is None:
-                if i is not None:
-                    poser.remove_pose(i)
-            else:
-                if i is None:
-                    i = poser.add_pose()
-                    cmds.connectAttr(
-                        pose, poser.get_pose(i).format(poser.pose_weight_attr))
-                try:
-                    poser.set_pose_value(i, *value)
-                except TypeError:
-                    poser.set_pose_value(i, value)
+        with self._bulk_edit('set_pose_values'):
+            for poser, i in self._iter_pose_indices(self._pose_outputs(pose)):
+                value = values.get(poser, None)
+                if value is None or poser.trim_value(value) is None:
+                    if i is not None:
+                        poser.remove_pose(i)
+                else:
+                    if i is None:
+                        i = poser.add_pose()
+                        cmds.connectAttr(
+                            pose,
+                            poser.get_pose(i).format(poser.pose_weight_attr))
+                    try:
+                        poser.set_pose_value(i, *value)
+                    except TypeError:
+                        poser.set_pose_value(i, value)
+        self._invalidate_pose_outputs()
 
     def sum_poses(self, indices):
         """Sum the values of two or more poses.
@@ -905,11 +1288,20 @@ class PoserSet(node.System):
         Yields:
             tuple: (poser, summed pose value(s)) pairs.
         """
-        d = {poser: [0, i] if i is not None else [0]
-             for poser, i in self.get_pose(indices[0])}
+        if len(indices) == 1:
+            # nothing to merge: skip the per-poser index map entirely
+            for poser, i in self.get_pose(indices[0]):
+                yield poser, poser.sum_poses([0, i] if i is not None else [0])
+            return
+        d = defaultdict(list)
+        for poser, i in self.get_pose(indices[0]):
+            d[poser].append(0)
+            if i is not None:
+                d[poser].append(i)
         for index in indices[1:]:
-            [d[poser].append(i) for poser, i in self.get_pose(index)
-             if i is not None]
+            for poser, i in self.get_pose(index):
+                if i is not None:
+                    d[poser].append(i)
         for poser in self.posers:
             yield poser, poser.sum_poses(d[poser])
 
@@ -927,6 +1319,29 @@ class PoserSet(node.System):
         for x in self.posers:
             yield x.attr
 
+    def _float_attrs(self, attrs):
+        """Filter input attributes down to the float (pose) ones.
+
+        Types are read through the API function set, avoiding a getAttr
+        round-trip per attribute.
+
+        Args:
+            attrs (iterable of str): user defined attribute names.
+
+        Returns:
+            set of str: names of the float attributes.
+        """
+        fn = self.fn
+        numeric = om.MFnNumericAttribute()
+        result = set()
+        for x in attrs:
+            obj = fn.attribute(x)
+            if obj.hasFn(om.MFn.kNumericAttribute):
+                numeric.setObject(obj)
+                if numeric.numericType() == om.MFnNumericData.kFloat:
+                    result.add(x)
+        return result
+
     @property
     def groups(self):
         """Get pose groups and their nested poses.
@@ -934,20 +1349,17 @@ class PoserSet(node.System):
         Returns:
             dict: {group (str): poses (list of str)}
         """
-        root = self.name
-        poses = cmds.listAttr(root, ud=1, s=1) or []
-        result = []
-        grp = ['', []]
+        poses = cmds.listAttr(self.name, ud=1, s=1) or []
+        float_attrs = self._float_attrs(poses)
+        result = {}
+        current = ''
         for x in poses:
-            if cmds.getAttr(f'{root}.{x}', type=1) != 'float':
-                if any(grp):
-                    result.append(grp)
-                grp = [x, []]
+            if x in float_attrs:
+                result.setdefault(current, []).append(x)
             else:
-                grp[1].append(x)
-        if any(grp):
-            result.append(grp)
-        return OrderedDict(result)
+                current = x
+                result.setdefault(current, [])
+        return result
 
     @property
     @IndexableGenerator.cast
@@ -959,10 +1371,9 @@ class PoserSet(node.System):
         """
         for obj in cmds.listConnections(f'{self.name}.message',
                                         s=0, d=1) or []:
-            try:
-                yield Poser.get_class(obj)(obj)
-            except TypeError:
-                pass
+            poser = _poser_for(obj)
+            if poser is not None:
+                yield poser
 
     @property
     def poses(self):
@@ -975,9 +1386,9 @@ class PoserSet(node.System):
         Returns:
             list of str: pose attribute name.
         """
-        root = self.name
-        return [x for x in cmds.listAttr(root, ud=1, s=1) or []
-                if cmds.getAttr(f'{root}.{x}', type=1) == 'float']
+        attrs = cmds.listAttr(self.name, ud=1, s=1) or []
+        float_attrs = self._float_attrs(attrs)
+        return [x for x in attrs if x in float_attrs]
 
     @property
     @IndexableGenerator.cast
@@ -5,13 +5,17 @@ spaces for a given object.
 In Maya, this is normally achieved by adding constraints to transform nodes,
 with multiple targets (spaces), and modulating the influence weight of each
 target.
+
+Performance note: the hot paths in this module are bound by Maya command
+round-trips, not computation. See _HOT_PATH_NOTES.
 """
+import functools
 from collections import OrderedDict
 from numbers import Number
 from types import NoneType
 from typing import Any, Iterable, Iterator, Optional
 
-from ma import cmds, get_nc, node
+from ma import cmds, get_nc, node, om
 from py import IndexableGenerator, T_IndexableGenerator
 
 from . import R, S, T, control
@@ -30,10 +34,118 @@ CNS_MAP = OrderedDict(
     pointConstraint='p',
     scaleConstraint='s'
 )
+#: enum index of each constraint channel code in the 'type' attribute
+CNS_TYPE_INDEX = {v: i for i, v in enumerate(CNS_MAP.values())}
 REV_CNS_MAP = {'a': 'r', 'o': 'r', 'p': 't', 'r': 'r', 's': 's', 't': 't'}
 WUT = ['scene', 'object', 'objectrotation', 'vector', 'none']
 nc = get_nc()
 
+_HOT_PATH_NOTES = """
+Every cmds.* invocation costs a Python<->MEL marshalling round-trip, which
+dwarfs the Python work around it on rigs with many constraints. When editing
+the compare/serialize/add paths, count command calls, not instructions:
+prefer one batched query (or an OpenMaya plug read) over N per-item calls.
+"""
+
+
+@functools.lru_cache(maxsize=4096)
+def _object_type(name: str) -> str:
+    """Memoized node type lookup.
+
+    Args:
+        name: node name.
+
+    Returns:
+        Maya node type.
+    """
+    return cmds.objectType(name)
+
+
+@functools.lru_cache(maxsize=4096)
+def _is_a(name: str, parent_type: str) -> bool:
+    """Memoized type-hierarchy test.
+
+    Args:
+        name: node name.
+        parent_type: candidate ancestor node type.
+
+    Returns:
+        True if the node's type derives from parent_type.
+    """
+    return cmds.objectType(name, isa=parent_type)
+
+
+# node names can be reused once constraints are deleted or recreated, so
+# mutators below and scene changes drop the memos
+def _clear_type_caches(*args):
+    _object_type.cache_clear()
+    _is_a.cache_clear()
+
+
+for _event in (om.MSceneMessage.kBeforeNew, om.MSceneMessage.kBeforeOpen):
+    om.MSceneMessage.addCallback(_event, _clear_type_caches)
+
+
+def _filter_existing(names: Iterable[str]) -> dict[str, bool]:
+    """Check scene existence of several names in one pass.
+
+    One incremental selection list replaces an objExists command
+    round-trip per name.
+
+    Args:
+        names: node names to probe.
+
+    Returns:
+        {name: exists} pairs.
+    """
+    sel = om.MSelectionList()
+    result = {}
+    for name in names:
+        try:
+            sel.add(name)
+            result[name] = True
+        except RuntimeError:
+            result[name] = False
+    return result
+
+
+def _resolve_plugs(paths: Iterable[str]) -> list[om.MPlug]:
+    """Resolve attribute paths to plugs through one selection list.
+
+    A single C++ name resolve replaces a getAttr command round-trip per
+    attribute.
+
+    Args:
+        paths: full 'node.attr' path of each plug.
+
+    Returns:
+        One plug per input path, in order.
+    """
+    sel = om.MSelectionList()
+    for path in paths:
+        sel.add(path)
+    return [sel.getPlug(i) for i in range(sel.length())]
+
+
+def _double3(plug: om.MPlug, unit: Optional[str] = None) -> list[float]:
+    """Read a compound of three doubles from a plug.
+
+    Args:
+        plug: compound plug holding three numeric children.
+        unit: 'angular' or 'linear' to convert the values from internal
+            units (radians / centimeters) to UI units, matching what
+            getAttr would return; None reads unitless doubles as-is.
+
+    Returns:
+        The three child values.
+    """
+    values = [plug.child(j).asDouble() for j in range(3)]
+    if unit == 'angular':
+        values = [om.MAngle.internalToUI(x) for x in values]
+    elif unit == 'linear':
+        values = [om.MDistance.internalToUI(x) for x in values]
+    return values
+
 
 def compare(
         a: str, b: str
@@ -47,13 +159,7 @@ def compare(
     Returns:
         Constraint differences.
     """
-    cns_type = cmds.objectType(a)
-    if cns_type == 'aimConstraint':
-        return compare_a(a, b)
-    elif cns_type == 'parentConstraint':
-        return compare_rt(a, b)
-    else:
-        return compare_sop(a, b)
+    return _COMPARE_DISPATCH.get(_object_type(a), compare_sop)(a, b)
 
 
 def compare_a(a: str, b: str) -> dict[str, Any]:
@@ -71,12 +177,20 @@ def compare_a(a: str, b: str) -> dict[str, Any]:
     """
     d, attrs = [], ['aimVector', 'offset', 'upVector', 'worldUpVector']
     for cns in (a, b):
-        d = {'targets': cmds.aimConstraint(cns, q=1, tl=1) or [],
-             'worldUpType': cmds.getAttr(f'{cns}.wut'),
-             'worldUpMatrix': (
-                 cmds.listConnections(f'{cns}.wum', s=1, d=0) or [None])[0]}
-        d.update({k: [round(x, 5) for x in cmds.getAttr(f'{cns}.{k}')]
-                  for k in attrs})
+        plugs = _resolve_plugs(
+            [f'{cns}.wut', f'{cns}.wum'] + [f'{cns}.{k}' for k in attrs])
+        source = plugs[1].source()
+        entry = {'targets': cmds.aimConstraint(cns, q=1, tl=1) or [],
+                 'worldUpType': plugs[0].asInt(),
+                 'worldUpMatrix': (
+                     None if source.isNull else
+                     om.MFnDependencyNode(source.node()).name())}
+        # the offset is angular; the three vectors are unitless
+        entry.update({k: [round(x, 5)
+                          for x in _double3(
+                              plug, 'angular' if k == 'offset' else None)]
+                      for k, plug in zip(attrs, plugs[2:])})
+        d.append(entry)
     result = {'targets': [[x for x in d[i]['targets']
                            if x not in d[1 - i]['targets']]
                           for i in range(2)],
@@ -100,14 +214,20 @@ def compare_rt(a: str, b: str) -> tuple[dict[str, Any], dict[str, Any]]:
     Raises:
         ValueError: If any of the inputs isn't a parentConstraint
     """
-    if any(not cmds.objectType(x, isa='parentConstraint') for x in [a, b]):
+    if any(not _is_a(x, 'parentConstraint') for x in [a, b]):
         raise ValueError("please provide two parentConstraints")
-    dicts = [
-        {k: [[round(x, 5)
-              for x in cmds.getAttr(f'{cns}.target[{i}].{at}')[0]]
-             for at in ['targetOffsetTranslate', 'targetOffsetRotate']]
-         for i, k in enumerate(cmds.parentConstraint(cns, q=1, tl=1) or [])}
-        for cns in [a, b]]
+    dicts = []
+    for cns in [a, b]:
+        targets = cmds.parentConstraint(cns, q=1, tl=1) or []
+        plugs = _resolve_plugs(
+            f'{cns}.target[{i}].targetOffset{at}'
+            for i in range(len(targets)) for at in ('Translate', 'Rotate'))
+        dicts.append(
+            {k: [[round(x, 5)
+                  for x in _double3(plugs[i * 2 + j],
+                                    ('linear', 'angular')[j])]
+                 for j in range(2)]
+             for i, k in enumerate(targets)})
     return tuple(
         {k: v for k, v in d.items()
          if k not in dicts[1 - i] or v != dicts[1 - i][k]}
@@ -128,17 +248,22 @@ def compare_sop(a: str, b: str) -> dict[str, Any]:
         ValueError:
             If not both constraints are scale, orient or point constraints.
     """
-    cns_type = cmds.objectType(a)
+    cns_type = _object_type(a)
     if (
-        cmds.objectType(b) != cns_type
+        _object_type(b) != cns_type
         or cns_type not in ['scaleConstraint',
                             'orientConstraint',
                             'pointConstraint']
     ):
         raise ValueError(
             "please provide two valid constraints of the same type.")
+    # orient offsets are angles, point offsets distances, scale unitless
+    unit = {'orientConstraint': 'angular',
+            'pointConstraint': 'linear'}.get(cns_type)
     dicts = [{'targets': getattr(cmds, cns_type)(cns, q=1, tl=1) or [],
-              'offset': [round(x, 5) for x in cmds.getAttr(f'{cns}.offset')]}
+              'offset': [round(x, 5)
+                         for x in _double3(
+                             _resolve_plugs([f'{cns}.offset'])[0], unit)]}
              for cns in [a, b]]
     return {'targets': [[x for x in d['targets']
                          if x not in dicts[1 - i]['targets']]
@@ -147,9 +272,94 @@ def compare_sop(a: str, b: str) -> dict[str, Any]:
                                              dicts[1]['offset'])]}
 
 
+# comparison and equality handlers per constraint type, for O(1) dispatch
+_COMPARE_DISPATCH = {
+    'aimConstraint': compare_a,
+    'parentConstraint': compare_rt,
+}
+
+
+def equal_a(a: str, b: str) -> bool:
+    """Check if two aim constraints are identical, cheapest checks first.
+
+    Args:
+        a: Name of first aim constraint.
+        b: Name of second aim constraint.
+
+    Returns:
+        True if the two constraints are equal, False otherwise.
+    """
+    if (set(cmds.aimConstraint(a, q=1, tl=1) or [])
+            != set(cmds.aimConstraint(b, q=1, tl=1) or [])):
+        return False
+    wut_a, wut_b = _resolve_plugs([f'{a}.wut', f'{b}.wut'])
+    if wut_a.asInt() != wut_b.asInt():
+        return False
+    comp = compare_a(a, b)
+    return not (comp['worldUpMatrix']
+                or any(y for x in ['aimVector', 'offset', 'upVector',
+                                   'worldUpVector']
+                       for y in comp[x]))
+
+
+def equal_rt(a: str, b: str) -> bool:
+    """Check if two parent constraints are identical, targets first.
+
+    Args:
+        a: Name of first parent constraint.
+        b: Name of second parent constraint.
+
+    Returns:
+        True if the two constraints are equal, False otherwise.
+    """
+    if (set(cmds.parentConstraint(a, q=1, tl=1) or [])
+            != set(cmds.parentConstraint(b, q=1, tl=1) or [])):
+        return False
+    return not any(compare_rt(a, b))
+
+
+def equal_sop(a: str, b: str) -> bool:
+    """Check if two scale/orient/point constraints are identical.
+
+    Args:
+        a: Name of first constraint.
+        b: Name of second constraint.
+
+    Returns:
+        True if the two constraints are equal, False otherwise.
+
+    Raises:
+        ValueError:
+            If not both constraints are scale, orient or point constraints.
+    """
+    cns_type = _object_type(a)
+    if (
+        _object_type(b) != cns_type
+        or cns_type not in ['scaleConstraint',
+                            'orientConstraint',
+                            'pointConstraint']
+    ):
+        raise ValueError(
+            "please provide two valid constraints of the same type.")
+    func = getattr(cmds, cns_type)
+    if set(func(a, q=1, tl=1) or []) != set(func(b, q=1, tl=1) or []):
+        return False
+    return not any(compare_sop(a, b)['offset'])
+
+
+_EQUAL_DISPATCH = {
+    'aimConstraint': equal_a,
+    'parentConstraint': equal_rt,
+}
+
+
 def equal(a: str, b: str) -> bool:
     """Check if two constraints are identical.
 
+    Discriminators are tested cheapest-first, so constraints that differ
+    structurally are rejected after a couple of calls instead of a full
+    comparison.
+
     Args:
         a: Name of first constraint.
         b: Name of second constraint.
@@ -157,19 +367,7 @@ def equal(a: str, b: str) -> bool:
     Returns:
         True if the two constraints are equal, False otherwise.
     """
-    cns_type = cmds.objectType(a)
-    comp = compare(a, b)
-    if cns_type == 'parentConstraint':
-        return not any(x for x in comp)
-    elif cns_type == 'aimConstraint':
-        return not (comp['targets']
-                    or comp['worldUpType']
-                    or comp['worldUpMatrix']
-                    or any(y for x in ['aimVector', 'offset', 'upVector',
-                                       'worldUpVector']
-                           for y in comp[x]))
-    else:
-        return not (comp['targets'] or any(x for x in comp['offset']))
+    return _EQUAL_DISPATCH.get(_object_type(a), equal_sop)(a, b)
 
 
 @IndexableGenerator.cast
@@ -211,10 +409,12 @@ def merge(a: str, b: str):
         'scaleConstraint': ['cs']
     }
 
-    cns_type = cmds.objectType(a)
-    if cmds.objectType(b) != cns_type:
+    cns_type = _object_type(a)
+    if _object_type(b) != cns_type:
         raise TypeError("please provide two constraints of the same type.")
 
+    # rewires stay on undoable commands, matching the cmds.delete below:
+    # a modifier would leave undo resurrecting 'a' with moved connections
     for at in attrs[cns_type]:
         for ch in 'xyz':
             src = f'{b}.{at}{ch}'
@@ -222,6 +422,7 @@ def merge(a: str, b: str):
             for dest in dests:
                 cmds.connectAttr(src, dest, f=1)
     cmds.delete(a)
+    _clear_type_caches()
 
 
 def split(cns: str, *targets: int) -> str:
@@ -236,19 +437,33 @@ def split(cns: str, *targets: int) -> str:
         Name of the new constraint.
     """
     cns2 = cmds.duplicate(cns)[0]
-    inputs = cmds.listConnections(cns, s=1, d=0, p=1, c=1)
-    for src, dest in zip(inputs[1::2], inputs[::2]):
-        dest_node, dest_attr = dest.split('.', 1)
-        if dest_node == cns:  # handle connections to itself
-            src = src.replace(cns, cns2)
-        cmds.connectAttr(src, f'{cns2}.{dest_attr}')
-    connections = cmds.listConnections(cns, s=0, d=1, p=1, c=1)
+    sel = om.MSelectionList()
+    sel.add(cns)
+    cns_obj = sel.getDependNode(0)
+    # mirror incoming connections onto the duplicate: enumeration walks
+    # the plug graph natively, while the edits stay on undoable commands
+    # to match the cmds.duplicate above
+    for plug in om.MFnDependencyNode(cns_obj).getConnections():
+        attr_path = plug.partialName(useFullAttributePath=True,
+                                     useLongNames=True)
+        for src in plug.connectedTo(True, False):
+            if src.node() == cns_obj:  # handle connections to itself
+                src_path = '{}.{}'.format(
+                    cns2, src.partialName(useFullAttributePath=True,
+                                          useLongNames=True))
+            else:
+                src_path = src.name()
+            cmds.connectAttr(src_path, f'{cns2}.{attr_path}')
+    # outputs keep the command enumeration: callers pass target indices
+    # derived from the same listConnections ordering
+    connections = cmds.listConnections(cns, s=0, d=1, p=1, c=1) or []
     outputs = [(src, dest)
                for src, dest in zip(connections[::2], connections[1::2])
                if dest.split('.', 1)[0] != cns]
     for i in targets:
         cmds.connectAttr(f'{cns2}.{outputs[i][0].split(".", 1)[1]}',
                          outputs[i][1], f=1)
+    _clear_type_caches()
     return cns2
 
 
@@ -267,6 +482,15 @@ class SpaceSwitchGuide(node.Node):
     when the constraints are created.
     """
 
+    _indices_cache = None
+    """list or None: memoized constraint entry indices."""
+    _cns_attr_cache = None
+    """str or None: cached path of the constraints attribute."""
+
+    def _clear_name_caches(self, *args):
+        super()._clear_name_caches(*args)
+        self._cns_attr_cache = None
+
     @classmethod
     def create(
             cls, name: Optional[str] = None, parent: Optional[str] = None
@@ -339,22 +563,27 @@ class SpaceSwitchGuide(node.Node):
             result.append(index)
             kwargs['channels'] = channels
             cmds.getAttr(f'{self.cns_attr}[{index}].type')  # create
+            self._indices_cache = None  # the new entry extends the array
             self.set(**kwargs)  # set up
         return result
 
     def create_attributes(self):
         """Create the hierarchy of constraints attributes on the node.
 
-        Can be run multiple times, as only the missing attributes are created.
+        Can be run multiple times, as only the missing attributes are
+        created. Edits stay on undoable addAttr commands - a raw API build
+        would bypass the undo queue, which this codebase commits to -
+        with the existence checks answered through the function set.
         """
+        fn = self.fn
         name = self.name
         # driven channels
-        if not cmds.attributeQuery('ss_channels', n=name, ex=1):
+        if not fn.hasAttribute('ss_channels'):
             cmds.addAttr(name, ln='ss_channels', at='compound', nc=9)
             for ch in S[1:] + R[1:] + T[1:]:
                 cmds.addAttr(name, ln=f'{ch}_', at='message', p='ss_channels')
         # constraints array
-        if not cmds.attributeQuery('ss_constraints', n=name, ex=1):
+        if not fn.hasAttribute('ss_constraints'):
             cmds.addAttr(
                 name, ln='ss_constraints', at='compound', nc=7, multi=1)
             cmds.addAttr(
@@ -379,6 +608,50 @@ class SpaceSwitchGuide(node.Node):
                 name, ln='up_type', at='enum', p='ss_constraints',
                 en=':'.join(WUT), dv=2)
 
+    def _walk_constraint(self, index: int) -> tuple:
+        """Read one constraint entry through a single compound traversal.
+
+        One plug walk supplies everything serialize_constraint needs,
+        instead of a command round-trip per field and per target.
+
+        Args:
+            index: Index of the constraint entry.
+
+        Returns:
+            (channels, targets, weights, offset, constraint type,
+            up type, up target) of the entry.
+        """
+        cns_plug = self.fn.findPlug(
+            'ss_constraints', False).elementByLogicalIndex(index)
+        # children in creation order: type, message_, offset, targets,
+        # up_target_msg, up_target_ref, up_type
+        cns_type = list(CNS_MAP)[cns_plug.child(0).asInt()]
+        code = CNS_MAP[cns_type]
+        channels = [x.partialName(useLongNames=True)[:-1]
+                    for x in cns_plug.child(1).destinations()]
+        if code not in ('s', 'rt'):
+            channels = [f'{code}{x[1:]}' for x in channels]
+        targets_plug = cns_plug.child(3)
+        targets, weights = [], []
+        for j in range(targets_plug.numElements()):
+            element = targets_plug.elementByPhysicalIndex(j)
+            source = element.child(0).source()
+            target = (None if source.isNull else
+                      om.MFnDependencyNode(source.node()).name())
+            if not target:
+                target = element.child(1).asString()
+            if not target:
+                continue
+            targets.append(target)
+            weights.append(element.child(2).asFloat())
+        up_source = cns_plug.child(4).source()
+        up_target = (None if up_source.isNull else
+                     om.MFnDependencyNode(up_source.node()).name())
+        if not up_target:
+            up_target = cns_plug.child(5).asString()
+        return (channels, targets, weights, cns_plug.child(2).asBool(),
+                cns_type, cns_plug.child(6).asInt(), up_target)
+
     def get_driven_channels(self, index: int) -> list[str]:
         """Get channels driven by the constraint entry at input index.
 
@@ -423,6 +696,7 @@ class SpaceSwitchGuide(node.Node):
     def remove(self, index: int = -1):
         """Remove a constraint entry."""
         cmds.removeMultiInstance(f'{self.cns_attr}[{self.indices[index]}]', b=1)
+        self._indices_cache = None
 
     def serialize(self) -> OrderedDict:
         """Serialize this SpaceSwitchGuide.
@@ -453,25 +727,22 @@ class SpaceSwitchGuide(node.Node):
                     [aimConstraint specific settings]
                 }
         """
-        cns_attr = f'{self.cns_attr}[{index}]'
+        (channels, targets, weights, offset,
+         cns_type, up_type, up_target) = self._walk_constraint(index)
         # channels
-        result = {'channels': self.get_driven_channels(index)}
-        if not result['channels']:
+        if not channels:
             return
+        result = {'channels': channels}
         # targets and weights
-        result['targets'], result['weights'] = zip(
-            *self.get_target_weights(index))
-        if not result['targets']:
+        if not targets:
             return
+        result['targets'], result['weights'] = targets, weights
         # offsets
-        result['offset'] = cmds.getAttr(cns_attr + '.offset')
+        result['offset'] = offset
         # aim constraint specific settings
-        if cmds.getAttr(f'{cns_attr}.type', asString=1) == 'aimConstraint':
-            result['wut'] = cmds.getAttr(cns_attr + '.up_type')
-            result['wuo'] = (cmds.listConnections(
-                f'{cns_attr}.up_target_msg', s=1, d=0) or [None])[0]
-            if not result['wuo']:
-                result['wuo'] = cmds.getAttr(f'{cns_attr}.up_target_ref')
+        if cns_type == 'aimConstraint':
+            result['wut'] = up_type
+            result['wuo'] = up_target
         return result
 
     def set(
@@ -507,8 +778,8 @@ class SpaceSwitchGuide(node.Node):
             # set type
             cmds.setAttr(
                 f'{cns_attr}.type',
-                list(CNS_MAP.values()).index(
-                    'rt' if channels[0][0] in 'rt' else channels[0][0]))
+                CNS_TYPE_INDEX[
+                    'rt' if channels[0][0] in 'rt' else channels[0][0]])
             # connect channels
             ch_attr = f'{self.channels_attr}.{{}}_'
             source = f'{cns_attr}.message_'
@@ -519,11 +790,15 @@ class SpaceSwitchGuide(node.Node):
         # targets and weights
         targets = kwargs.get('targets', [])
         weights = kwargs.get('weights', [1.0] + [0.0] * (len(targets) - 1))
+        wuo = kwargs.get('wuo')
+        # probe every candidate name in one pass
+        exists = _filter_existing(
+            list(targets) + ([wuo] if wuo else []))
         for i, target in enumerate(targets):
             target_attr = f'{cns_attr}.targets[{i}]'
             # message connect if it exists or set as string otherwise
             (cmds.connectAttr(f'{target}.msg', f'{target_attr}.target_msg')
-             if cmds.objExists(target) else
+             if exists[target] else
              cmds.setAttr(f'{target_attr}.target_ref', target, type='string'))
             # set its weight
             cmds.setAttr(f'{target_attr}.weight', weights[i])
@@ -542,20 +817,24 @@ class SpaceSwitchGuide(node.Node):
         # aim constraint specific settings
         if 'wut' in kwargs:
             cmds.setAttr(f'{cns_attr}.up_type', kwargs['wut'])
-        wuo = kwargs.get('wuo')
         if wuo:
             (cmds.connectAttr(wuo, f'{cns_attr}.up_target_msg')
-             if cmds.objExists(wuo) else
+             if exists[wuo] else
              cmds.setAttr(f'{cns_attr}.up_target_ref', wuo, type='string'))
 
     @property
     def cns_attr(self) -> str:
         """Name of the multi-compound attribute representing each constraint.
 
+        Built once per node name; renames drop the cached path.
+
         Returns:
             attribute name.
         """
-        return f'{self.name}.ss_constraints'
+        attr = self._cns_attr_cache
+        if attr is None:
+            attr = self._cns_attr_cache = f'{self.name}.ss_constraints'
+        return attr
 
     @property
     def channels_attr(self) -> str:
@@ -570,10 +849,17 @@ class SpaceSwitchGuide(node.Node):
     def indices(self) -> list[int]:
         """Get the indices of each constraint definition entry.
 
+        Memoized, so iterating entries costs one multi-index query;
+        entry additions and removals drop the memo.
+
         Returns:
             List of indices.
         """
-        return cmds.getAttr(self.cns_attr, mi=1) or []
+        indices = self._indices_cache
+        if indices is None:
+            indices = self._indices_cache = (
+                cmds.getAttr(self.cns_attr, mi=1) or [])
+        return indices
 
 
 class SpaceSwitch(node.Node):
@@ -644,6 +930,7 @@ class SpaceSwitch(node.Node):
         # update constraints dictionary
         del constraints[None]
         constraints[cns] = unconstrained_channels
+        _clear_type_caches()  # the new constraint may reuse an old name
 
     def _split(self, constraints: dict[str, Iterable[str]]):
         """Fork constraints which affect unspecified channels.
@@ -681,7 +968,7 @@ class SpaceSwitch(node.Node):
         for x in constraints:
             if (
                 x is False
-                or x and not cmds.objectType(x, isa=f'{type}Constraint')
+                or x and not _is_a(x, f'{type}Constraint')
             ):
                 ch = ', '.join([f'{self.name}.{y}' for y in constraints[x]])
                 raise TypeError(f"{ch} driven by non-{type}Constraint '{x}'")
@@ -1047,7 +1334,7 @@ class SpaceSwitch(node.Node):
         for channel in channels or S[1:] + R[1:] + T[1:]:
             source = cmds.listConnections(f'{self.name}.{channel}', s=1, d=0)
             if source:
-                if cmds.objectType(source[0], isa='constraint'):
+                if _is_a(source[0], 'constraint'):
                     yield source[0]
                 else:
                     yield False
@@ -1086,7 +1373,7 @@ class SpaceSwitch(node.Node):
         for cns in result:
             w = []
             if cns:
-                f = getattr(cmds, cmds.objectType(cns))
+                f = getattr(cmds, _object_type(cns))
                 w = f(f(cns, q=1, tl=1), cns, q=1, w=1)
             result[cns].append([w] if isinstance(w, Number) else w)
         return result
@@ -1105,9 +1392,9 @@ class SpaceSwitch(node.Node):
         channels = channels or S[1:] + R[1:] + T[1:]
         constraints = list(set(x for x in self.get_cns(*channels) if x))
         for i, cns in enumerate(constraints):
-            cns_type = cmds.objectType(cns)
+            cns_type = _object_type(cns)
             for other in constraints[i + 1:]:
-                if cmds.objectType(other) == cns_type and equal(cns, other):
+                if _object_type(other) == cns_type and equal(cns, other):
                     merge(cns, other)
                     break
 
@@ -1135,9 +1422,10 @@ class SpaceSwitch(node.Node):
         for cns in constraints:
             if cns is None:
                 continue
-            func = getattr(cmds, cmds.objectType(cns))
+            func = getattr(cmds, _object_type(cns))
             targets = targets or func(cns, q=1, tl=1)
             func(targets, cns, rm=1)
+        _clear_type_caches()  # removing every target deletes a constraint
 
     def serialize(self) -> OrderedDict:
         """Serialize this SpaceSwitch.
@@ -1152,7 +1440,7 @@ class SpaceSwitch(node.Node):
         for cns, channels in cnss.items():
             if not cns:
                 continue
-            cns_type = cmds.objectType(cns)
+            cns_type = _object_type(cns)
             func = getattr(cmds, cns_type)
             weights = next(iter(self.get_weights(*channels).values()))[1]
             if cns_type not in ('parentConstraint', 'scaleConstraint'):
@@ -1187,7 +1475,7 @@ class SpaceSwitch(node.Node):
         for cns in set(self.get_cns(*channels)):
             if cns is None:
                 continue
-            f = getattr(cmds, cmds.objectType(cns))
+            f = getattr(cmds, _object_type(cns))
             targets = f(cns, q=1, tl=1)
             if isinstance(weights, Number):
                 weights = [weights] * len(targets)
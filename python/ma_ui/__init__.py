@@ -1,6 +1,3 @@
-import shiboken2
-from maya import OpenMayaUI
-
 from py_ui import QtCore, QtGui, QtWidgets  # noqa
 
 
@@ -10,5 +7,10 @@ def get_maya_window() -> QtWidgets.QMainWindow:
     Returns:
         QMainWindow holding Maya's main GUI.
     """
+    # deferred so headless (mayapy) imports of ma_ui don't pay for the
+    # gui-only bindings.
+    import shiboken2
+    from maya import OpenMayaUI
+
     ptr = OpenMayaUI.MQtUtil.mainWindow()
     return shiboken2.wrapInstance(ptr, QtWidgets.QMainWindow)
@@ -60,18 +60,21 @@ def fuzzy_match(string, pattern, case_sensitive=False):
     Returns:
         list of 2-list of int: in-out indices of matched substrings.
     """
+    if not pattern:
+        return []
     if not case_sensitive:
         string, pattern = string.lower(), pattern.lower()
-    cursor, slices = 0, []
-    for i, char in enumerate(string):
-        if char == pattern[cursor]:
-            if slices and i == slices[-1][-1]:
-                slices[-1][-1] = i + 1
-            else:
-                slices.append([i, i + 1])
-            cursor += 1
-            if cursor >= len(pattern):
-                break
+    slices, pos = [], 0
+    for char in pattern:
+        # str.find runs the character scan in C
+        i = string.find(char, pos)
+        if i < 0:
+            break
+        if slices and i == slices[-1][-1]:
+            slices[-1][-1] = i + 1
+        else:
+            slices.append([i, i + 1])
+        pos = i + 1
     return slices
 
 
@@ -114,6 +117,9 @@ class IndexableGenerator:
     """Holds the values already extracted from the generator."""
     it: Iterator[Any]
     """Pointer to the input generator."""
+    _pos: Optional[dict]
+    """Maps each hashable value to its first cache index; set to None once
+    an unhashable value disables the constant-time lookup."""
 
     def __init__(self, it: Iterator[Any]):
         """Default constructor.
@@ -123,6 +129,7 @@ class IndexableGenerator:
         """
         self.cache: list[Any] = []
         self.it: Iterator[Any] = it
+        self._pos: Optional[dict] = {}
 
     def __getitem__(self, index: int | slice) -> tuple[Any] | Any:
         """Get value(s) at input index/indices from the stream of values.
@@ -134,21 +141,51 @@ class IndexableGenerator:
         Returns:
             Either a tuple of values or a single value at input index/indices.
         """
-        head = len(self.cache)
         if isinstance(index, slice):
-            if index.start < 0 or index.stop < 0:
+            start, stop, step = index.start, index.stop, index.step
+            if step is not None and step < 0:
+                # negative steps walk backwards from start, which becomes
+                # the bound the cache must reach
+                if start is None or start < 0:
+                    self._consume()
+                else:
+                    self._ensure(start + 1)
+            elif (start is not None and start < 0) \
+                    or stop is None or stop < 0:
                 self._consume()
-            elif index.stop > head:
-                r = list(itertools.islice(self.it, index.stop - head))
-                self.cache.extend(r)
+            else:
+                self._ensure(stop)
         elif index < 0:
             if not len(self):
                 return
-        elif index > head - 1:
-            r = list(itertools.islice(self.it, index - head + 1))
-            self.cache.extend(r)
-            head += len(r)
-        return self.cache.__getitem__(index)
+        else:
+            self._ensure(index + 1)
+        return self.cache[index]
+
+    def _ensure(self, n: int):
+        """Extend the cache to hold at least n values, supply permitting.
+
+        Args:
+            n: number of leading values required in the cache.
+        """
+        head = len(self.cache)
+        if n > head:
+            self.cache.extend(itertools.islice(self.it, n - head))
+            self._record_positions(head)
+
+    def __bool__(self):
+        """Check for emptiness by peeking a single value, if needed.
+
+        Unlike len, this doesn't consume the rest of the generator.
+        """
+        if self.cache:
+            return True
+        try:
+            self.cache.append(next(self.it))
+        except StopIteration:
+            return False
+        self._record_positions(len(self.cache) - 1)
+        return True
 
     def __iter__(self):
         return itertools.chain(self.cache, self._iter())
@@ -157,24 +194,52 @@ class IndexableGenerator:
         self._consume()
         return len(self.cache)
 
+    def __length_hint__(self):
+        """Lower bound on the sequence length, for pre-sizing consumers."""
+        return len(self.cache)
+
     def __next__(self):
         """Transparently delegate calls to next() to the inside generator."""
         try:
             result = next(self.it)
             self.cache.append(result)
+            self._record_positions(len(self.cache) - 1)
             return result
         except StopIteration:
             return None
 
     def _consume(self):
-        result = list(self.it)
-        self.cache.extend(result)
+        head = len(self.cache)
+        self.cache.extend(self.it)
+        self._record_positions(head)
 
     def _iter(self):
+        # bound methods hoisted out of the per-value loop
+        cache = self.cache
+        append = cache.append
+        record = self._record_positions
         for x in self.it:
-            self.cache.append(x)
+            append(x)
+            record(len(cache) - 1)
             yield x
 
+    def _record_positions(self, head: int):
+        """Register the cache position of values appended from an index on.
+
+        Args:
+            head: cache index of the first value to register.
+        """
+        pos = self._pos
+        if pos is None:
+            return
+        cache = self.cache
+        try:
+            for i in range(head, len(cache)):
+                pos.setdefault(cache[i], i)
+        except TypeError:
+            # unhashable value: disable the map for this sequence
+            self._pos = None
+
     @classmethod
     def cast(cls, func: Callable) -> Callable:
         """Decorator for functions returning a generator."""
@@ -195,6 +260,19 @@ class IndexableGenerator:
         Raises:
             ValueError: raised when item not found.
         """
+        pos = self._pos
+        if pos is not None:
+            try:
+                i = pos.get(item)
+            except TypeError:
+                i = None
+            else:
+                if i is None:
+                    for x in self._iter():
+                        if x == item:
+                            return len(self.cache) - 1
+                    raise ValueError(f"{item} not in IndexableGenerator")
+                return i
         if item in self.cache:
             return self.cache.index(item)
         for x in self._iter():
@@ -2,10 +2,16 @@
 
 """Converts old NgSkinTools data files to the new NgSkinTools2 format."""
 
-import copy
 import argparse
 import json
 import os
+from collections import defaultdict, deque
+
+try:
+    # C-accelerated json de/serialization, when available
+    import orjson
+except ImportError:
+    orjson = None
 
 
 def convert(in_data):
@@ -22,13 +28,12 @@ def convert(in_data):
             'triangles': in_data['meshInfo']['triangles'],
             'vertPositions': in_data['meshInfo']['verts']
         },
-        'influences': copy.deepcopy(list(in_data['influences'].values())),
+        # complete influences with missing keys; a shallow merge per
+        # influence keeps the input untouched without a recursive deepcopy
+        'influences': [{**v, 'labelText': '', 'labelSide': 0}
+                       for v in in_data['influences'].values()],
     }
 
-    # complete influences with missing keys
-    for v in out_data['influences']:
-        v.update({'labelText': '', 'labelSide': 0})
-
     # parse layers
     layers = []
     n_layers = len(in_data['layers'])
@@ -71,20 +76,41 @@ def convert(in_data):
         for j, child in enumerate(layer['children']):
             layers[child - 1]['index'] = j
 
-    # reorder layers so parents are declared before their children
-    seen = {None}
-    out_data['layers'] = []
-    while layers:
-        for layer in layers:
-            if layer['parentId'] in seen:
-                out_data['layers'].append(layer)
-                seen.add(layer['id'])
-                layers.remove(layer)
-                break
+    # reorder layers so parents are declared before their children:
+    # a single breadth-first pass over a children-by-parent map
+    children_by_parent = defaultdict(list)
+    for layer in layers:
+        children_by_parent[layer['parentId']].append(layer)
+    out_layers = []
+    queue = deque(children_by_parent.get(None, ()))
+    while queue:
+        layer = queue.popleft()
+        out_layers.append(layer)
+        queue.extend(children_by_parent.get(layer['id'], ()))
+    out_data['layers'] = out_layers
 
     return out_data
 
 
+def _walk_json(root):
+    """Recursively yield the paths of .json files under input directory.
+
+    scandir-based, so each entry's type comes from the directory listing
+    instead of a stat call per file.
+
+    Args:
+        root (str): directory to walk.
+
+    Yields:
+        str: path of each json file.
+    """
+    for entry in os.scandir(root):
+        if entry.is_dir(follow_symlinks=False):
+            yield from _walk_json(entry.path)
+        elif entry.name.endswith('.json'):
+            yield entry.path
+
+
 def convert_from_path(source, destination=None):
     """ Convert source NgSkinTools1 file(s) to the new NgSkinTools2 format.
 
@@ -95,23 +121,29 @@ def convert_from_path(source, destination=None):
     if not os.path.exists(source):
         raise IOError("source doesn't exist: " + source)
 
-    is_dir = os.path.isdir(source)
-    if is_dir:
+    if os.path.isdir(source):
         if not destination:
             destination = source
-        base = len(source) + 1
-        fp = {os.path.join(x[0], y): os.path.join(destination, x[0][base:], y)
-              for x in os.walk(source) for y in x[2] if y.endswith('.json')}
+        fp = {p: os.path.join(destination, os.path.relpath(p, source))
+              for p in _walk_json(source)}
     else:
         fp = {source: destination or source}
 
     for k, v in sorted(fp.items()):
         print("converting {}\nto         {}\n".format(k, v))
         folder = os.path.dirname(v)
-        if not os.path.exists(folder):
-            os.makedirs(folder)
-        json.dump(convert(json.load(open(k, 'r'))),
-                  fp=open(v, 'w'), indent=2)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        if orjson is not None:
+            with open(k, 'rb') as src:
+                out_data = convert(orjson.loads(src.read()))
+            with open(v, 'wb') as dest:
+                dest.write(orjson.dumps(out_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(k, 'r') as src:
+                out_data = convert(json.load(src))
+            with open(v, 'w') as dest:
+                json.dump(out_data, fp=dest, indent=2)
 
 
 if __name__ == '__main__':
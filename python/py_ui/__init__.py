@@ -1,4 +1,3 @@
-from functools import partial
 from typing import Callable, Iterable, Optional, Sequence, Tuple
 
 from PySide2 import QtCore, QtGui, QtWidgets  # noqa
@@ -26,6 +25,8 @@ class MultiButton(QtWidgets.QWidget):
     """toggles automatic action on switch."""
     current_action: Callable
     """the action fired when clicking the major button."""
+    _switch_icon = None
+    """Drop-down button icon, shared by every instance."""
 
     def __init__(
             self,
@@ -59,8 +60,10 @@ class MultiButton(QtWidgets.QWidget):
         # drop down button
         btn = self.switch_btn = QtWidgets.QPushButton()
         layout.addWidget(btn)
-        btn.setIcon(self.style().standardIcon(
-            QtWidgets.QStyle.SP_TitleBarUnshadeButton))
+        if MultiButton._switch_icon is None:
+            MultiButton._switch_icon = self.style().standardIcon(
+                QtWidgets.QStyle.SP_TitleBarUnshadeButton)
+        btn.setIcon(MultiButton._switch_icon)
         i = self.font().pointSize()
         btn.setIconSize(QtCore.QSize(i, i))
         btn.setStyleSheet('QPushButton::menu-indicator{width:0px;}')
@@ -92,7 +95,9 @@ class MultiButton(QtWidgets.QWidget):
         menu = QtWidgets.QMenu(self)
         for x in value:
             action = menu.addAction(x[0])
-            action.triggered.connect(partial(self.switch_act, x))
+            # default-arg binding; triggered also emits a checked bool
+            action.triggered.connect(
+                lambda _checked=False, x=x: self.switch_act(x))
         self.switch_btn.setMenu(menu)
         self.switch(value[0])
 
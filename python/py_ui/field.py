@@ -93,6 +93,8 @@ class LineEditWithDel(QtWidgets.QLineEdit):
     """holds functions to be called in order upon an editingFinished signal.
     These functions are called with the new text value of this widget as an
     argument."""
+    _clear_icon = None
+    """Clear button icon, shared by every instance."""
 
     def __init__(self, *args, **kwargs):
         """Default constructor."""
@@ -102,8 +104,10 @@ class LineEditWithDel(QtWidgets.QLineEdit):
         btn.setStyleSheet("background-color: rgba(255, 255, 255, 0);"
                           "border: none")
         btn.hide()
-        btn.setIcon(self.style().standardIcon(
-            QtWidgets.QStyle.SP_DialogCloseButton))
+        if LineEditWithDel._clear_icon is None:
+            LineEditWithDel._clear_icon = self.style().standardIcon(
+                QtWidgets.QStyle.SP_DialogCloseButton)
+        btn.setIcon(LineEditWithDel._clear_icon)
         btn.clicked.connect(self.clear)
         layout = QtWidgets.QHBoxLayout()
         layout.addStretch()
@@ -121,7 +125,8 @@ class LineEditWithDel(QtWidgets.QLineEdit):
     def edit_finished(self):
         """Execute any listening functions upon finishing editing text."""
         txt = self.text()
-        [x(txt) for x in self.listeners]
+        for x in self.listeners:
+            x(txt)
 
     def clear(self):
         """Clear the text in this line edit and inform listening functions."""
@@ -458,6 +463,12 @@ class SearchBar(QtWidgets.QWidget):
         self.search_listeners = []
 
         super().__init__(*args, **kwargs)
+        # debounce timer: bursts of edits collapse into one listener pass
+        self._pending = ''
+        self._debounce = QtCore.QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(80)
+        self._debounce.timeout.connect(self._fire_search)
         metrics = QtGui.QFontMetricsF(self.font())
         layout = QtWidgets.QHBoxLayout(self)
         layout.setSpacing(0)
@@ -497,15 +508,22 @@ class SearchBar(QtWidgets.QWidget):
 
         These arguments are the input pattern, search method and case
         sensitivity.
-        Called when the text line in this widget is edited.
+        Called when the text line in this widget is edited. Triggers are
+        debounced, so edit bursts only run the listeners once.
 
         Args:
             text: search pattern as per the LineEditWithDel sub-widget.
         """
+        self._pending = text
+        self._debounce.start()
+
+    def _fire_search(self):
+        """Run the listening functions with the last requested search."""
+        text = self._pending
         search_method = self.search_method
         case_sensitive = self.case_sensitive
-        [x(text, search_method, case_sensitive)
-         for x in self.search_listeners]
+        for x in self.search_listeners:
+            x(text, search_method, case_sensitive)
 
     def toggle_case_sensitive(self):
         """Toggle the case_sensitive attribute value."""
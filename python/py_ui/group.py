@@ -43,21 +43,24 @@ class Splitter(QtWidgets.QSplitter):
         sizes = self.sizes()
         sizes[i - 1: i + 1] = [w / 2] * 2
         self.setSizes(sizes)
-        [f() for f in self.drag_listeners]
+        for f in self.drag_listeners:
+            f()
 
     def distribute_handles(self):
         """Evenly distribute SplitterHandles."""
         attr = ('width', 'height')[self.orientation() == Qt.Vertical]
         n_widgets = self.count()
         self.setSizes([getattr(self, attr)() / float(n_widgets)] * n_widgets)
-        [f() for f in self.drag_listeners]
+        for f in self.drag_listeners:
+            f()
 
     def rotate(self):
         """Alternate Splitter's orientation between vertical and horizontal."""
         ori = [Qt.Orientation.Vertical, Qt.Orientation.Horizontal]
         i = 1 - ori.index(self.orientation())
         self.setOrientation(ori[i])
-        [f(i) for f in self.rotate_listeners]
+        for f in self.rotate_listeners:
+            f(i)
 
     @property
     @IndexableGenerator.cast
@@ -83,6 +86,7 @@ class SplitterHandle(QtWidgets.QSplitterHandle):
             parent: Default is None.
         """
         super(SplitterHandle, self).__init__(orientation, parent)
+        self._cached_index = None
         self.setContextMenuPolicy(Qt.CustomContextMenu)
         self.customContextMenuRequested.connect(self.launch_context_menu)
 
@@ -90,13 +94,20 @@ class SplitterHandle(QtWidgets.QSplitterHandle):
     def index(self) -> int:
         """Get the index of this handle in the Splitter's handles array.
 
+        The index is cached after the first lookup and revalidated against
+        the splitter, which reshuffles handles as widgets come and go.
+
         Returns:
             index of this SplitterHandle
         """
         par = self.splitter()
         n_widgets = par.count()
+        i = self._cached_index
+        if i is not None and i < n_widgets and par.handle(i) is self:
+            return i
         for i in range(n_widgets):
             if par.handle(i) is self:
+                self._cached_index = i
                 return i
 
     def mousePressEvent(self, event: QtGui.QMouseEvent):
@@ -1,8 +1,47 @@
-from py import fuzzy_match
+import functools
+import re
 
 from . import QtCore
 
 
+def _char_mask(text: str) -> int:
+    """Fold a string's characters into a 64-bit membership mask.
+
+    Args:
+        text: string to fingerprint.
+
+    Returns:
+        mask with one bit per (folded) character.
+    """
+    mask = 0
+    for char in text:
+        mask |= 1 << (ord(char) & 63)
+    return mask
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_filter(pattern: str, case_sensitive: bool) -> QtCore.QRegExp:
+    """Build, or reuse, the wildcard QRegExp for a search.
+
+    Keystroke-driven searches recompile the same few patterns over and
+    over; a small cache makes the reuses free. QRegExp has value
+    semantics, so handing a cached instance to several proxies is safe.
+
+    Args:
+        pattern: search string. Accepts wildcards syntax.
+        case_sensitive: whether matching considers character case.
+
+    Returns:
+        compiled QRegExp.
+    """
+    return QtCore.QRegExp(
+        pattern,
+        cs=(QtCore.Qt.CaseSensitive
+            if case_sensitive else
+            QtCore.Qt.CaseInsensitive),
+        syntax=QtCore.QRegExp.Wildcard)
+
+
 class ProxyModel(QtCore.QSortFilterProxyModel):
     """ProxyModel with recursive nested search.
 
@@ -23,6 +62,22 @@ class ProxyModel(QtCore.QSortFilterProxyModel):
     """0 = Regex; 1 = fuzzy. Default: 1"""
     case_sensitive: bool = False
     """If true, take character case into account. Default: False"""
+    _pat_lower: str = ''
+    """filter_pattern, pre-lowercased for case-insensitive searches."""
+    _subseq_re = None
+    """compiled subsequence pattern; the accept/reject scan runs in the C
+    regex engine instead of a per-character Python loop."""
+    _pat_len: int = 0
+    """length of the current pattern, for cheap candidate rejection."""
+    _pat_mask: int = 0
+    """character mask of the current pattern: rows lacking any of its
+    characters are rejected with a single AND."""
+    _exact: str = ''
+    """the pattern as a contiguous substring: pasted full names hit this
+    single containment check before any subsequence scan."""
+    _tokens: tuple = ()
+    """literal tokens of a pure-wildcard regex pattern; rows whose text
+    contains them in order are accepted without touching Qt's regex."""
 
     def __init__(self, model: QtCore.QAbstractItemModel):
         """Default constructor.
@@ -31,10 +86,151 @@ class ProxyModel(QtCore.QSortFilterProxyModel):
             model: source model for this proxy.
         """
         super().__init__()
+        # memoized per-row verdicts: Qt re-queries the same rows many
+        # times while sorting, expanding and repainting
+        self._verdicts = {}
+        # per-row (text, lowered text, length, character mask) fingerprints
+        self._masks = {}
+        # flattened (key, parent key) visit order of the source tree
+        self._flat = None
+        # rows accepted by the previous pattern, when the new one extends it
+        self._restrict = None
+        # connected before setSourceModel, so the caches are invalidated
+        # ahead of the proxy's own refiltering on these signals
+        model.dataChanged.connect(self._on_data_changed)
+        for signal in (model.rowsInserted, model.rowsRemoved,
+                       model.modelReset):
+            signal.connect(self._clear_model_caches)
         self.setSourceModel(model)
         self.setDynamicSortFilter(True)
         self.setFilterKeyColumn(-1)
 
+    def _clear_model_caches(self, *args):
+        """Drop model-derived caches when rows move or the model resets."""
+        self._masks.clear()
+        self._flat = None
+        self._clear_verdicts()
+
+    def _on_data_changed(self, top_left, bottom_right, *args):
+        """Refresh the fingerprints of edited rows only.
+
+        Edits don't move rows, so the flattened order and every other
+        row's fingerprint stay valid; just the affected range is
+        recomputed, and only the verdicts are dropped.
+        """
+        model = self.sourceModel()
+        parent = top_left.parent()
+        parent_id = parent.internalId()
+        masks = self._masks
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            key = (parent_id, row)
+            if key in masks:
+                text = model.itemFromIndex(
+                    model.index(row, 0, parent)).text()
+                lower = text.lower()
+                masks[key] = (text, lower, len(text), _char_mask(lower))
+        self._clear_verdicts()
+
+    def _clear_verdicts(self, *args):
+        """Drop memoized filter verdicts after model or pattern changes."""
+        self._verdicts.clear()
+        self._restrict = None
+
+    def _batch_fuzzy_pass(self):
+        """Filter the whole source tree in one flat pass.
+
+        A single top-down walk fingerprints and tests every row, then a
+        reversed sweep propagates child acceptance to the ancestors.
+        filterAcceptsRow afterwards answers each of Qt's queries from the
+        verdict memo instead of re-walking descendants per row.
+        """
+        search = self._subseq_re.search
+        pat_len, pat_mask = self._pat_len, self._pat_mask
+        masks = self._masks
+        restrict = self._restrict
+        verdicts = self._verdicts
+        order = self._flat_order()
+        text_column = 0 if self.case_sensitive else 1
+        exact = self._exact
+        for key, parent_key in order:
+            if restrict is not None and key not in restrict:
+                # a prefix of the pattern already rejected this row
+                verdicts[key] = False
+                continue
+            entry = masks[key]
+            if entry[2] < pat_len or (entry[3] & pat_mask) != pat_mask:
+                verdicts[key] = False
+                continue
+            text = entry[text_column]
+            # contiguous match short-circuits the subsequence scan
+            verdicts[key] = exact in text or search(text) is not None
+        # bottom-up: an accepted row keeps its ancestors visible
+        for key, parent_key in reversed(order):
+            if verdicts[key] and parent_key is not None:
+                verdicts[parent_key] = True
+        self._restrict = None
+
+    def _flat_order(self):
+        """Get, building if needed, the flattened source tree.
+
+        One walk caches the visit order, per-row keys and text
+        fingerprints, so later filter passes run on plain dict and list
+        lookups without re-entering Qt for index/rowCount/item calls.
+
+        Returns:
+            list of tuple: (row key, parent row key) pairs, parents always
+            before their descendants.
+        """
+        flat = self._flat
+        if flat is None:
+            model = self.sourceModel()
+            masks = self._masks
+            flat = self._flat = []
+            append = flat.append
+            stack = [(QtCore.QModelIndex(), None)]
+            while stack:
+                parent_index, parent_key = stack.pop()
+                parent_id = parent_index.internalId()
+                for row in range(model.rowCount(parent_index)):
+                    key = (parent_id, row)
+                    index = model.index(row, 0, parent_index)
+                    if key not in masks:
+                        text = model.itemFromIndex(index).text()
+                        lower = text.lower()
+                        masks[key] = (
+                            text, lower, len(text), _char_mask(lower))
+                    append((key, parent_key))
+                    stack.append((index, key))
+        return flat
+
+    def _tokens_accept(self, row, parent_index):
+        """Check the wildcard pattern's literal tokens against a row.
+
+        Args:
+            row: a row under the parent_index QModelIndex.
+            parent_index: holder of the input row.
+
+        Returns:
+            True if the row's text contains every token, in order.
+        """
+        masks = self._masks
+        key = (parent_index.internalId(), row)
+        entry = masks.get(key)
+        if entry is None:
+            model = self.sourceModel()
+            text = model.itemFromIndex(
+                model.index(row, 0, parent_index)).text()
+            lower = text.lower()
+            entry = masks[key] = (text, lower, len(text), _char_mask(lower))
+        text = entry[0] if self.case_sensitive else entry[1]
+        pos = 0
+        for token in self._tokens:
+            pos = text.find(token, pos)
+            if pos < 0:
+                return False
+            pos += len(token)
+        return True
+
     def fuzzy_filter(
             self, source_row: int, source_index: QtCore.QModelIndex) -> bool:
         """Fuzzy matching method for filtering items in the proxy model.
@@ -49,32 +245,44 @@ class ProxyModel(QtCore.QSortFilterProxyModel):
         Returns:
             True if a row is valid, False otherwise.
         """
-        def recursion(row, parent_index):
-            index = model.index(row, 0, parent_index)
-            if not index.isValid():
-                return False
-            child_count = model.rowCount(index)
-            if not child_count:
+        def accepts(row, parent_index):
+            key = (parent_index.internalId(), row)
+            entry = masks.get(key)
+            if entry is None:
+                text = model.itemFromIndex(
+                    model.index(row, 0, parent_index)).text()
+                lower = text.lower()
+                entry = masks[key] = (
+                    text, lower, len(text), _char_mask(lower))
+            # cheap rejections first: length, then character membership
+            if entry[2] < pat_len or (entry[3] & pat_mask) != pat_mask:
                 return False
-            for i in range(child_count):
-                item = model.itemFromIndex(model.index(i, 0, index))
-                result = fuzzy_match(item.text(), pattern, self.case_sensitive)
-                if sum(x[1] - x[0] for x in result) == pattern_len:
-                    return True
-                if recursion(i, index):
-                    return True
-            return False
+            text = entry[0] if case_sensitive else entry[1]
+            # contiguous match short-circuits the subsequence scan
+            return exact in text or search(text) is not None
 
-        pattern = self.filter_pattern
-        if not pattern:
+        if self._subseq_re is None:
             return True
-        pattern_len = len(pattern)
+        search = self._subseq_re.search
+        pat_len, pat_mask = self._pat_len, self._pat_mask
+        case_sensitive = self.case_sensitive
+        exact = self._exact
+        masks = self._masks
         model = self.sourceModel()
-        item = model.itemFromIndex(model.index(source_row, 0, source_index))
-        result = fuzzy_match(item.text(), pattern, self.case_sensitive)
-        if sum(x[1] - x[0] for x in result) == pattern_len:
+        if accepts(source_row, source_index):
             return True
-        return recursion(source_row, source_index)
+        # explicit-stack depth-first walk of the descendants
+        stack = [(source_row, source_index)]
+        while stack:
+            row, parent_index = stack.pop()
+            index = model.index(row, 0, parent_index)
+            if not index.isValid():
+                continue
+            for i in range(model.rowCount(index)):
+                if accepts(i, index):
+                    return True
+                stack.append((i, index))
+        return False
 
     def regex_filter(
             self, source_row: int, source_index: QtCore.QModelIndex) -> bool:
@@ -90,24 +298,32 @@ class ProxyModel(QtCore.QSortFilterProxyModel):
         Returns:
             True if a row is valid, False otherwise.
         """
-        def recursion(row, parent_index):
-            index = model.index(row, 0, parent_index)
-            if not index.isValid():
-                return False
-            child_count = model.rowCount(index)
-            if not child_count:
-                return False
-            for i in range(child_count):
-                if super().filterAcceptsRow(i, index):
-                    return True
-                if recursion(i, index):
-                    return True
-            return False
+        base = super().filterAcceptsRow
+        if self._tokens:
+            tokens_accept = self._tokens_accept
 
-        if super().filterAcceptsRow(source_row, source_index):
+            def accepts(row, parent_index):
+                # DFA-style token hops on cached text; Qt's backtracking
+                # regex only runs when the fast path misses
+                return (tokens_accept(row, parent_index)
+                        or base(row, parent_index))
+        else:
+            accepts = base
+        if accepts(source_row, source_index):
             return True
         model = self.sourceModel()
-        return recursion(source_row, source_index)
+        # explicit-stack depth-first walk of the descendants
+        stack = [(source_row, source_index)]
+        while stack:
+            row, parent_index = stack.pop()
+            index = model.index(row, 0, parent_index)
+            if not index.isValid():
+                continue
+            for i in range(model.rowCount(index)):
+                if accepts(i, index):
+                    return True
+                stack.append((i, index))
+        return False
 
     def filterAcceptsRow(
             self, source_row: int, source_index: QtCore.QModelIndex) -> bool:
@@ -123,8 +339,25 @@ class ProxyModel(QtCore.QSortFilterProxyModel):
         Returns:
             True if a row is valid, False otherwise.
         """
+        key = (source_index.internalId(), source_row)
+        cached = self._verdicts.get(key)
+        if cached is not None:
+            return cached
+        if (self.search_method == 1 and self._subseq_re is not None
+                and not self._verdicts):
+            # first query of a new search: resolve the whole tree at once
+            self._batch_fuzzy_pass()
+            cached = self._verdicts.get(key)
+            if cached is not None:
+                return cached
+        restrict = self._restrict
+        if restrict is not None and key not in restrict:
+            # rejected by a prefix of the current pattern: still rejected
+            self._verdicts[key] = False
+            return False
         f = self.fuzzy_filter if self.search_method == 1 else self.regex_filter
-        return f(source_row, source_index)
+        result = self._verdicts[key] = f(source_row, source_index)
+        return result
 
     def search(
             self,
@@ -142,12 +375,45 @@ class ProxyModel(QtCore.QSortFilterProxyModel):
             case_sensitive: If set to True, only match characters to the pattern
                 if they have the same case.
         """
+        # subsequence matching is monotone: extending the pattern can only
+        # shrink the accepted set, so only those rows need retesting. The
+        # previous pass must have produced verdicts though - an unqueried
+        # proxy would otherwise restrict the new pattern to nothing.
+        extends = bool(
+            text and self.filter_pattern and self._verdicts
+            and search_method == 1 and self.search_method == 1
+            and case_sensitive == self.case_sensitive
+            and text.startswith(self.filter_pattern))
+        restrict = ({k for k, v in self._verdicts.items() if v}
+                    if extends else None)
+        changed = (text != self.filter_pattern
+                   or case_sensitive != self.case_sensitive)
         self.filter_pattern = text
+        self._pat_lower = (text or '').lower()
+        self._pat_len = len(self._pat_lower)
+        self._pat_mask = _char_mask(self._pat_lower)
+        self._exact = ((text if case_sensitive else self._pat_lower)
+                       if text else '')
+        # wildcard-only regex patterns decompose into ordered literal
+        # tokens, testable with plain find calls
+        self._tokens = ()
+        if text and search_method == 0 and not any(c in text for c in '?[]'):
+            self._tokens = tuple(
+                t for t in (text if case_sensitive else
+                            self._pat_lower).split('*') if t)
+        # match against pre-lowered row text rather than folding case
+        # per character inside the regex engine
+        self._subseq_re = (re.compile(
+            '.*?'.join(map(re.escape,
+                           text if case_sensitive else self._pat_lower)))
+            if text else None)
         self.search_method = search_method
         self.case_sensitive = case_sensitive
-        self.setFilterRegExp(QtCore.QRegExp(
-            text,
-            cs=(QtCore.Qt.CaseSensitive
-                if case_sensitive else
-                QtCore.Qt.CaseInsensitive),
-            syntax=QtCore.QRegExp.Wildcard))
+        self._clear_verdicts()
+        self._restrict = restrict
+        if changed:
+            self.setFilterRegExp(_compile_filter(text, case_sensitive))
+        else:
+            # same pattern (e.g. a method toggle): skip the Qt regex
+            # rebuild and just ask for a re-filter
+            self.invalidateFilter()